@@ -1,4 +1,6 @@
 import joblib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 from config import settings
@@ -11,41 +13,79 @@ print(f"\n{'='*80}")
 print(f"GLOBAL MODEL PERFORMANCE SUMMARY")
 print(f"{'='*80}\n")
 
-summary_data = []
 
-for symbol in symbols:
-    latest = model_dir / f'ensemble_{symbol}_1h_latest.pkl'
+def load_metadata(path):
+    """
+    Load summary metadata for an ensemble pickle
     
-    if not latest.exists():
+    Reads the .meta.json sidecar written at training time; falls back to
+    unpickling the ensemble (memory-mapped) and writes the sidecar for next time.
+    """
+    meta_path = path.with_suffix('.meta.json')
+    if meta_path.exists():
+        with open(meta_path) as f:
+            return json.load(f)
+    
+    data = joblib.load(path, mmap_mode='r')
+    stacking = data['performance'].get('stacking')
+    metadata = {
+        'best_model_name': data['best_model_name'],
+        'best_accuracy': float(data['best_accuracy']),
+        'stacking_acc': float(stacking['test_accuracy']) if stacking else None
+    }
+    try:
+        with open(meta_path, 'w') as f:
+            json.dump(metadata, f)
+    except OSError:
+        pass
+    return metadata
+
+
+COLS = ("Symbol", "Best Model", "Best Accuracy", "Stacking Acc")
+
+# Load every model's metadata in parallel
+model_paths = {symbol: model_dir / f'ensemble_{symbol}_1h_latest.pkl' for symbol in symbols}
+existing = {symbol: path for symbol, path in model_paths.items() if path.exists()}
+
+with ThreadPoolExecutor(max_workers=max(1, min(8, len(existing)))) as executor:
+    loads = {
+        symbol: executor.submit(load_metadata, path)
+        for symbol, path in existing.items()
+    }
+
+
+def make_row(symbol):
+    """Build one summary row, or None when the model is missing or unreadable"""
+    if symbol not in loads:
         print(f"⚠️ No model found for {symbol}")
-        continue
+        return None
         
     try:
-        data = joblib.load(latest)
+        data = loads[symbol].result()
         best_model = data['best_model_name']
         best_acc = data['best_accuracy']
         
         # Get stacking accuracy if available, otherwise best
-        stacking_acc = 0
-        if 'stacking' in data['performance']:
-            stacking_acc = data['performance']['stacking']['test_accuracy']
+        stacking_acc = data['stacking_acc'] or 0
             
-        summary_data.append({
-            'Symbol': symbol,
-            'Best Model': best_model,
-            'Best Accuracy': f"{best_acc:.4f}",
-            'Stacking Acc': f"{stacking_acc:.4f}" if stacking_acc else "N/A"
-        })
+        return (
+            symbol,
+            best_model,
+            f"{best_acc:.4f}",
+            f"{stacking_acc:.4f}" if stacking_acc else "N/A"
+        )
         
     except Exception as e:
         print(f"❌ Error loading {symbol}: {e}")
+        return None
+
 
 # Display summary table
-if summary_data:
-    df = pd.DataFrame(summary_data)
+rows = (make_row(symbol) for symbol in symbols)
+df = pd.DataFrame.from_records(filter(None, rows), columns=COLS)
+if not df.empty:
     print(df.to_string(index=False))
 else:
     print("No models loaded successfully.")
 
 print(f"\n{'='*80}")
-
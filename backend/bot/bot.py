@@ -1,19 +1,48 @@
-import time
+import asyncio
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to allow imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import requests
 from config import settings
 from services.signal_service import generate_signal_service
 from logger import logger
+from http_session import create_session, create_retry
+
+# Import constants
+try:
+    from constants import (
+        SIGNAL_FETCH_WORKERS, TELEGRAM_API_TIMEOUT, TELEGRAM_RETRY_ATTEMPTS, TELEGRAM_RETRY_DELAY,
+        EMOJI_BUY, EMOJI_SELL, SIGNAL_EMOJI, ALERT_MISFIRE_GRACE
+    )
+except ImportError:
+    SIGNAL_FETCH_WORKERS = 8
+    TELEGRAM_API_TIMEOUT = 10
+    TELEGRAM_RETRY_ATTEMPTS = 3
+    TELEGRAM_RETRY_DELAY = 2
+    ALERT_MISFIRE_GRACE = 60
+    EMOJI_BUY = "🟢"
+    EMOJI_SELL = "🔴"
+    SIGNAL_EMOJI = {
+        "BUY": EMOJI_BUY, "BUY (Trend)": EMOJI_BUY, "BUY (Weak)": EMOJI_BUY, "STRONG_BUY": EMOJI_BUY,
+        "SELL": EMOJI_SELL, "SELL (Trend)": EMOJI_SELL, "SELL (Weak)": EMOJI_SELL, "STRONG_SELL": EMOJI_SELL,
+        "NEUTRE": "⚪",
+    }
 
 # ⚠️ Configuration via settings
 BOT_TOKEN = settings.telegram_bot_token
 CHAT_ID = settings.telegram_chat_id
 
+# Pooled Telegram session; 429/5xx and connection errors are retried with backoff
+_TELEGRAM_SESSION = create_session(
+    max_retries=create_retry(total=TELEGRAM_RETRY_ATTEMPTS, backoff_factor=TELEGRAM_RETRY_DELAY)
+)
+
+# Shared pool for per-symbol signal generation (I/O-bound: Binance + inference)
+_POOL = ThreadPoolExecutor(max_workers=SIGNAL_FETCH_WORKERS, thread_name_prefix="alerts")
+
 def send_telegram_message(message):
     """Send message via Telegram API"""
     if not BOT_TOKEN or BOT_TOKEN == "":
@@ -26,12 +55,105 @@ def send_telegram_message(message):
 
     url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
     try:
-        response = requests.post(url, data={"chat_id": CHAT_ID, "text": message})
+        response = _TELEGRAM_SESSION.post(
+            url,
+            data={"chat_id": CHAT_ID, "text": message},
+            timeout=TELEGRAM_API_TIMEOUT
+        )
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Erreur envoi Telegram: {e}")
         return False
 
+async def _cycle(symbols, timeframe):
+    """Run one alert check: fetch every symbol's signal and send the summary"""
+    # Generate signals internally, one pool task per symbol
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_POOL, generate_signal_service, symbol, timeframe) for symbol in symbols),
+        return_exceptions=True
+    )
+    # gather keeps submission order so the message stays stable
+    signals = []
+    for symbol, s in zip(symbols, results):
+        if isinstance(s, Exception):
+            logger.error(f"Error generating signal for {symbol}: {s}")
+        elif "error" not in s:
+            signals.append(s)
+    
+    # Filter: only send BUY/SELL signals (not NEUTRE)
+    important_signals = [
+        s for s in signals 
+        if s["signal"] != "NEUTRE"
+    ]
+    
+    if important_signals:
+        # Group signals by type in one pass via the shared lookup table
+        grouped = {EMOJI_BUY: [], EMOJI_SELL: []}
+        for s in important_signals:
+            group = grouped.get(SIGNAL_EMOJI.get(s["signal"]))
+            if group is not None:
+                group.append(s)
+        buy_signals = grouped[EMOJI_BUY]
+        sell_signals = grouped[EMOJI_SELL]
+        
+        # Build message
+        msg_parts = ["🔔 **Nouveaux Signaux Détectés**\n"]
+        
+        if buy_signals:
+            msg_parts.append("🟢 **ACHATS:**")
+            for s in buy_signals:
+                msg_parts.append(
+                    f"  • {s['symbol']} - {s['signal']} "
+                    f"({int(s['confidence']*100)}%) - ${s['price']:.2f}"
+                )
+            msg_parts.append("")
+        
+        if sell_signals:
+            msg_parts.append("🔴 **VENTES:**")
+            for s in sell_signals:
+                msg_parts.append(
+                    f"  • {s['symbol']} - {s['signal']} "
+                    f"({int(s['confidence']*100)}%) - ${s['price']:.2f}"
+                )
+        
+        message = "\n".join(msg_parts)
+        logger.info(f"📤 Envoi alerte: {len(important_signals)} signaux")
+        await loop.run_in_executor(_POOL, send_telegram_message, message)
+    else:
+        logger.info("✓ Aucun signal important (tous NEUTRE)")
+
+
+async def _schedule(symbols, timeframe, interval_minutes):
+    """
+    Run _cycle on a fixed-rate schedule
+
+    Ticks are anchored to the loop clock so cycle duration does not cause
+    drift. A cycle never overlaps the next one; ticks missed by more than
+    ALERT_MISFIRE_GRACE seconds are coalesced into the next scheduled one.
+    """
+    loop = asyncio.get_running_loop()
+    interval = interval_minutes * 60
+    next_run = loop.time()
+    
+    while True:
+        try:
+            await _cycle(symbols, timeframe)
+        except Exception as e:
+            logger.error(f"❌ Erreur boucle bot: {e}")
+        
+        next_run += interval
+        now = loop.time()
+        if now - next_run > ALERT_MISFIRE_GRACE:
+            skipped = int((now - next_run) // interval) + 1
+            next_run += skipped * interval
+            logger.warning(f"⚠️ {skipped} vérification(s) manquée(s) ignorée(s)")
+        
+        # Wait before next check
+        logger.info(f"⏳ Prochaine vérification dans {max(0, next_run - now) / 60:.1f} minutes...")
+        await asyncio.sleep(max(0, next_run - now))
+
+
 def start_alerts(symbols=None, timeframe="1h", interval_minutes=5):
     """
     Start monitoring and sending alerts
@@ -43,61 +165,12 @@ def start_alerts(symbols=None, timeframe="1h", interval_minutes=5):
     logger.info(f"Cryptos: {', '.join(symbols)}")
     logger.info(f"Intervalle: {interval_minutes} minutes")
     
-    while True:
-        try:
-            # Generate signals internally
-            signals = []
-            for symbol in symbols:
-                try:
-                    s = generate_signal_service(symbol, timeframe)
-                    if "error" not in s:
-                        signals.append(s)
-                except Exception as e:
-                    logger.error(f"Error generating signal for {symbol}: {e}")
-            
-            # Filter: only send BUY/SELL signals (not NEUTRE)
-            important_signals = [
-                s for s in signals 
-                if s["signal"] != "NEUTRE"
-            ]
-            
-            if important_signals:
-                # Group signals by type
-                buy_signals = [s for s in important_signals if "BUY" in s["signal"]]
-                sell_signals = [s for s in important_signals if "SELL" in s["signal"]]
-                
-                # Build message
-                msg_parts = ["🔔 **Nouveaux Signaux Détectés**\n"]
-                
-                if buy_signals:
-                    msg_parts.append("🟢 **ACHATS:**")
-                    for s in buy_signals:
-                        msg_parts.append(
-                            f"  • {s['symbol']} - {s['signal']} "
-                            f"({int(s['confidence']*100)}%) - ${s['price']:.2f}"
-                        )
-                    msg_parts.append("")
-                
-                if sell_signals:
-                    msg_parts.append("🔴 **VENTES:**")
-                    for s in sell_signals:
-                        msg_parts.append(
-                            f"  • {s['symbol']} - {s['signal']} "
-                            f"({int(s['confidence']*100)}%) - ${s['price']:.2f}"
-                        )
-                
-                message = "\n".join(msg_parts)
-                logger.info(f"📤 Envoi alerte: {len(important_signals)} signaux")
-                send_telegram_message(message)
-            else:
-                logger.info("✓ Aucun signal important (tous NEUTRE)")
-                
-        except Exception as e:
-            logger.error(f"❌ Erreur boucle bot: {e}")
-
-        # Wait before next check
-        logger.info(f"⏳ Prochaine vérification dans {interval_minutes} minutes...")
-        time.sleep(interval_minutes * 60)
+    try:
+        asyncio.run(_schedule(list(symbols), timeframe, interval_minutes))
+    except KeyboardInterrupt:
+        logger.info("🛑 Alertes arrêtées")
+    finally:
+        _POOL.shutdown(wait=False)
 
 if __name__ == "__main__":
     start_alerts()
@@ -2,18 +2,36 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
+import time
+from collections import Counter
+from typing import Optional
+import httpx
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 from config import settings
-import requests
+from cache import cache
+from database import (
+    get_user_watchlists, add_watchlist_symbols, remove_watchlist_symbols,
+    get_last_signals, save_last_signals
+)
+
+# Fast JSON (de)serialization for backend payloads, stdlib fallback
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_dumps = lambda obj: json.dumps(obj).encode()
+    json_loads = json.loads
 
 # Import constants
 try:
     from constants import (
         DEFAULT_API_TIMEOUT, TELEGRAM_API_TIMEOUT, TELEGRAM_ALERT_CHECK_INTERVAL,
         TELEGRAM_RETRY_ATTEMPTS, TELEGRAM_RETRY_DELAY, MAX_BACKTEST_DAYS,
-        EMOJI_BUY, EMOJI_SELL, EMOJI_NEUTRAL, EMOJI_ALERT, EMOJI_SUCCESS, 
-        EMOJI_ERROR, EMOJI_CHART
+        ALERT_CHECK_CONCURRENCY, ALERT_CANDLE_SECONDS, TELEGRAM_MAX_MESSAGE_LENGTH, MAX_WATCHLIST, EMOJI_BUY, EMOJI_SELL, EMOJI_NEUTRAL, EMOJI_ALERT, EMOJI_SUCCESS, 
+        EMOJI_ERROR, EMOJI_CHART, SIGNAL_EMOJI
     )
 except ImportError:
     # Fallback if constants not available
@@ -23,6 +41,10 @@ except ImportError:
     TELEGRAM_RETRY_ATTEMPTS = 3
     TELEGRAM_RETRY_DELAY = 2
     MAX_BACKTEST_DAYS = 90
+    ALERT_CHECK_CONCURRENCY = 16
+    ALERT_CANDLE_SECONDS = 3600
+    TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+    MAX_WATCHLIST = 50
     EMOJI_BUY = "🟢"
     EMOJI_SELL = "🔴"
     EMOJI_NEUTRAL = "⚪"
@@ -30,13 +52,91 @@ except ImportError:
     EMOJI_SUCCESS = "✅"
     EMOJI_ERROR = "❌"
     EMOJI_CHART = "📊"
+    SIGNAL_EMOJI = {
+        "BUY": EMOJI_BUY, "BUY (Trend)": EMOJI_BUY, "BUY (Weak)": EMOJI_BUY, "STRONG_BUY": EMOJI_BUY,
+        "SELL": EMOJI_SELL, "SELL (Trend)": EMOJI_SELL, "SELL (Weak)": EMOJI_SELL, "STRONG_SELL": EMOJI_SELL,
+        "NEUTRE": EMOJI_NEUTRAL,
+    }
 
-# Configuration - use environment variable with fallback
+# Configuration from settings (environment / .env)
 BOT_TOKEN = settings.telegram_bot_token
-API_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
+API_URL = settings.backend_api_url
 
-# User watchlists (in-memory, could be moved to database)
+def _emoji(sig: str) -> str:
+    """Emoji for a signal label (unknown labels are treated as neutral)"""
+    return SIGNAL_EMOJI.get(sig, EMOJI_NEUTRAL)
+
+# Shared async HTTP client for the backend API (created in post_init)
+_HTTP: Optional[httpx.AsyncClient] = None
+
+# User watchlists (in-memory view, persisted to the database on change)
+# Values are interned frozensets: users watching the same symbols share one object
 user_watchlists = {}
+_watch_pool = {}
+
+def _intern_watchlist(symbols) -> frozenset:
+    """Return the shared frozenset for this set of symbols"""
+    key = frozenset(symbols)
+    if len(_watch_pool) > 2 * len(user_watchlists) + 64:
+        # Drop sets no user holds anymore
+        live = {id(w) for w in user_watchlists.values()}
+        for k in [k for k, w in _watch_pool.items() if id(w) not in live]:
+            del _watch_pool[k]
+    return _watch_pool.setdefault(key, key)
+
+def _normalize_symbols(args):
+    """Uppercase and add the USDT suffix, dropping duplicates but keeping order"""
+    symbols = []
+    for symbol in args:
+        symbol = symbol.upper()
+        if not symbol.endswith("USDT"):
+            symbol += "USDT"
+        if symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+async def _init_http(application: Application):
+    """Open the shared backend HTTP client once the event loop is running"""
+    global _HTTP
+    _HTTP = httpx.AsyncClient(
+        base_url=API_URL,
+        timeout=DEFAULT_API_TIMEOUT,
+        headers={"Content-Type": "application/json"},  # Bodies are pre-encoded with json_dumps
+        # Retry failed connection attempts (backend restarting) before giving up
+        transport=httpx.AsyncHTTPTransport(
+            retries=TELEGRAM_RETRY_ATTEMPTS,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+    )
+
+async def _load_state():
+    """Restore watchlists and last alerted signals saved before the last restart"""
+    try:
+        watchlists = await asyncio.to_thread(get_user_watchlists)
+        user_watchlists.update(
+            (user_id, _intern_watchlist(symbols)) for user_id, symbols in watchlists.items()
+        )
+        last_signals.update(await asyncio.to_thread(get_last_signals))
+        print(f"{EMOJI_SUCCESS} {len(user_watchlists)} watchlist(s) restaurée(s)")
+    except Exception as e:
+        print(f"Error restoring bot state: {e}")
+
+async def _post_init(application: Application):
+    """Startup hook: open the HTTP client and restore persisted state"""
+    await _init_http(application)
+    await _load_state()
+
+async def _shutdown(application: Application):
+    """Shutdown hook: persist pending alert state and close the HTTP client"""
+    await _flush_last_signals()
+    await _close_http(application)
+
+async def _close_http(application: Application):
+    """Close the shared backend HTTP client on shutdown"""
+    global _HTTP
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Welcome message"""
@@ -71,26 +171,31 @@ async def signal_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         symbol += "USDT"
     
     try:
-        response = requests.post(
-            f"{API_URL}/get-signal",
-            json={"symbol": symbol, "timeframe": "1h"},
-            timeout=DEFAULT_API_TIMEOUT
-        )
+        # Repeated /signal calls for the same symbol within the cache TTL skip the backend
+        cache_key = f"bot_signal_{symbol}_1h"
+        data = cache.get(cache_key)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is None:
+            response = await _HTTP.post(
+                "/get-signal",
+                content=json_dumps({"symbol": symbol, "timeframe": "1h"})
+            )
+            
+            if response.status_code != 200:
+                await update.message.reply_text("❌ Erreur lors de la récupération du signal")
+                return
+            
+            data = json_loads(response.content)
             
             if "error" in data:
                 await update.message.reply_text(f"❌ Erreur: {data['error']}")
                 return
             
-            emoji = EMOJI_NEUTRAL
-            if "BUY" in data['signal']:
-                emoji = EMOJI_BUY
-            elif "SELL" in data['signal']:
-                emoji = EMOJI_SELL
-            
-            msg = f"""
+            cache.set(cache_key, data)
+        
+        emoji = _emoji(data['signal'])
+        
+        msg = f"""
 {emoji} **Signal: {data['symbol']}**
 Timeframe: {data['timeframe']}
 Signal: **{data['signal']}**
@@ -102,10 +207,8 @@ RSI: {data['indicators']['rsi']:.2f}
 MACD: {data['indicators']['macd']:.2f}
 EMA20: {data['indicators']['ema20']:.2f}
 EMA50: {data['indicators']['ema50']:.2f}
-            """
-            await update.message.reply_text(msg)
-        else:
-            await update.message.reply_text("❌ Erreur lors de la récupération du signal")
+        """
+        await update.message.reply_text(msg)
     except Exception as e:
         await update.message.reply_text(f"❌ Erreur: {str(e)}")
 
@@ -117,16 +220,21 @@ async def watch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ Usage: /watch BTC ETH SOL")
         return
     
-    if user_id not in user_watchlists:
-        user_watchlists[user_id] = set()
+    current = user_watchlists.get(user_id, frozenset())
+    added = _normalize_symbols(context.args)
+    new = [symbol for symbol in added if symbol not in current]
+    if len(current) + len(new) > MAX_WATCHLIST:
+        await update.message.reply_text(
+            f"❌ Watchlist limitée à {MAX_WATCHLIST} cryptos ({len(current)} actuellement)"
+        )
+        return
     
-    added = []
-    for symbol in context.args:
-        symbol = symbol.upper()
-        if not symbol.endswith("USDT"):
-            symbol += "USDT"
-        user_watchlists[user_id].add(symbol)
-        added.append(symbol)
+    user_watchlists[user_id] = _intern_watchlist(current.union(new))
+    
+    try:
+        await asyncio.to_thread(add_watchlist_symbols, user_id, added)
+    except Exception as e:
+        print(f"Error saving watchlist for user {user_id}: {e}")
     
     await update.message.reply_text(f"✅ Ajouté à la watchlist: {', '.join(added)}")
 
@@ -142,16 +250,16 @@ async def unwatch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ Votre watchlist est vide")
         return
     
-    removed = []
-    for symbol in context.args:
-        symbol = symbol.upper()
-        if not symbol.endswith("USDT"):
-            symbol += "USDT"
-        if symbol in user_watchlists[user_id]:
-            user_watchlists[user_id].remove(symbol)
-            removed.append(symbol)
+    current = user_watchlists[user_id]
+    removed = [symbol for symbol in _normalize_symbols(context.args) if symbol in current]
     
     if removed:
+        user_watchlists[user_id] = _intern_watchlist(current.difference(removed))
+        try:
+            await asyncio.to_thread(remove_watchlist_symbols, user_id, removed)
+        except Exception as e:
+            print(f"Error saving watchlist for user {user_id}: {e}")
+        
         await update.message.reply_text(f"✅ Retiré de la watchlist: {', '.join(removed)}")
     else:
         await update.message.reply_text("❌ Aucune crypto trouvée dans votre watchlist")
@@ -166,14 +274,14 @@ async def list_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     try:
         symbols = list(user_watchlists[user_id])
-        response = requests.post(
-            f"{API_URL}/signals/multi",
-            json={"symbols": symbols, "timeframe": "1h"},
+        response = await _HTTP.post(
+            "/signals/multi",
+            content=json_dumps({"symbols": symbols, "timeframe": "1h"}),
             timeout=DEFAULT_API_TIMEOUT * 1.5  # Longer timeout for multiple signals
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             signals = data.get("signals", [])
             
             msg = "📋 **Votre Watchlist:**\n\n"
@@ -181,11 +289,7 @@ async def list_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 if "error" in signal:
                     continue
                     
-                emoji = EMOJI_NEUTRAL
-                if "BUY" in signal['signal']:
-                    emoji = EMOJI_BUY
-                elif "SELL" in signal['signal']:
-                    emoji = EMOJI_SELL
+                emoji = _emoji(signal['signal'])
                 
                 msg += f"{emoji} **{signal['symbol']}** - {signal['signal']} ({int(signal['confidence']*100)}%)\n"
                 msg += f"   Prix: ${signal['price']:.2f}\n\n"
@@ -199,25 +303,30 @@ async def list_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show performance statistics"""
     try:
-        response = requests.get(
-            f"{API_URL}/signals/history?limit=100",
-            timeout=DEFAULT_API_TIMEOUT
+        response = await _HTTP.get(
+            "/signals/history",
+            params={"limit": 100}
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             signals = data.get("signals", [])
             
             if not signals:
                 await update.message.reply_text("❌ Aucun signal dans l'historique")
                 return
             
-            # Calculate stats
-            buy_signals = len([s for s in signals if "BUY" in s['signal']])
-            sell_signals = len([s for s in signals if "SELL" in s['signal']])
-            neutral_signals = len([s for s in signals if s['signal'] == "NEUTRE"])
+            # Calculate stats in a single pass
+            counts = Counter()
+            total_confidence = 0.0
+            for s in signals:
+                counts[_emoji(s['signal'])] += 1
+                total_confidence += s['confidence']
             
-            avg_confidence = sum([s['confidence'] for s in signals]) / len(signals)
+            buy_signals = counts[EMOJI_BUY]
+            sell_signals = counts[EMOJI_SELL]
+            neutral_signals = counts[EMOJI_NEUTRAL]
+            avg_confidence = total_confidence / len(signals)
             
             msg = f"""
 📊 **Statistiques (100 derniers signaux)**
@@ -257,13 +366,14 @@ async def backtest_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(f"⏳ Lancement du backtest pour {symbol} sur {days} jours...")
     
     try:
-        response = requests.post(
-            f"{API_URL}/backtest?symbol={symbol}&days={days}",
+        response = await _HTTP.post(
+            "/backtest",
+            params={"symbol": symbol, "days": days},
             timeout=60  # Backtest can take longer
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             
             if "error" in data:
                 await update.message.reply_text(f"❌ Erreur: {data['error']}")
@@ -294,52 +404,141 @@ Profit Factor: {data['profit_factor']:.2f}
         await update.message.reply_text(f"❌ Erreur: {str(e)}")
 
 # Store last known signal for each user+symbol to avoid spam
-# Format: {user_id: {symbol: "BUY"}}
+# Format: {user_id: {symbol: "BUY"}} - persisted so restarts don't re-alert everyone
 last_signals = {}
 
+# Changes not yet written to the DB: {(user_id, symbol): signal}, flushed once per tick
+_dirty_last_signals = {}
+
+def _format_alert(signal) -> str:
+    """Render the alert text for one symbol's signal"""
+    emoji = _emoji(signal['signal'])
+    return (
+        f"{EMOJI_ALERT} **ALERTE {signal['symbol']}**\n\n"
+        f"{emoji} Nouveau signal: **{signal['signal']}**\n"
+        f"Prix: ${signal['price']:.2f}\n"
+        f"Confiance: {int(signal['confidence']*100)}%"
+    )
+
+async def _flush_last_signals():
+    """Write pending last-signal changes in a single transaction
+    
+    On failure the changes stay pending and are retried on the next flush.
+    """
+    if not _dirty_last_signals:
+        return
+    pending = dict(_dirty_last_signals)
+    _dirty_last_signals.clear()
+    try:
+        await asyncio.to_thread(
+            save_last_signals,
+            [(user_id, symbol, signal) for (user_id, symbol), signal in pending.items()]
+        )
+    except Exception as e:
+        print(f"Error saving last signals: {e}")
+        for key, signal in pending.items():
+            _dirty_last_signals.setdefault(key, signal)
+
+async def _dispatch_user_alerts(context: ContextTypes.DEFAULT_TYPE, semaphore: asyncio.Semaphore,
+                                user_id, alerts):
+    """Send one message to a user with every watched signal that changed
+    
+    alerts is a list of (symbol, signal, message) with pre-rendered messages.
+    """
+    try:
+        last_user_signals = last_signals.get(user_id, {})
+        changed = [
+            (symbol, current_signal, msg)
+            for symbol, current_signal, msg in alerts
+            if current_signal != last_user_signals.get(symbol)
+        ]
+        if not changed:
+            return
+        
+        # Coalesce all alerts into as few messages as Telegram's length limit allows
+        messages = []
+        for _, _, msg in changed:
+            if messages and len(messages[-1]) + len(msg) + 2 <= TELEGRAM_MAX_MESSAGE_LENGTH:
+                messages[-1] += "\n\n" + msg
+            else:
+                messages.append(msg)
+        
+        async with semaphore:
+            for text in messages:
+                await context.bot.send_message(chat_id=user_id, text=text)
+        
+        # Update last signals
+        if user_id not in last_signals:
+            last_signals[user_id] = {}
+        for symbol, current_signal, _ in changed:
+            last_signals[user_id][symbol] = current_signal
+            _dirty_last_signals[(user_id, symbol)] = current_signal
+                
+    except Exception as e:
+        print(f"Error checking alerts for user {user_id}: {e}")
+
 async def check_alerts(context: ContextTypes.DEFAULT_TYPE):
     """Background task to check for signals"""
-    for user_id, symbols in user_watchlists.items():
-        if not symbols:
-            continue
-            
+    # Snapshot the watchlists so /watch during the check can't mutate the iteration
+    watchlists = {user_id: symbols for user_id, symbols in list(user_watchlists.items()) if symbols}
+    if not watchlists:
+        return
+    
+    # Signals only change when a new 1h candle opens: reuse this candle's results
+    bucket = int(time.time()) // ALERT_CANDLE_SECONDS
+    supported = set(settings.default_cryptos)
+    by_symbol = {}
+    missing = []
+    for symbol in sorted({s for symbols in watchlists.values() for s in symbols if s in supported}):
+        cached = cache.get(f"alert_signal_{symbol}_1h_{bucket}")
+        if cached is None:
+            missing.append(symbol)
+        else:
+            by_symbol[symbol] = cached
+    
+    # One backend request per tick for the union of the symbols not seen this candle.
+    # Unsupported symbols would make the backend reject the whole batch.
+    if missing:
         try:
-            # Fetch signals for all symbols
-            response = requests.post(
-                f"{API_URL}/signals/multi",
-                json={"symbols": list(symbols), "timeframe": "1h"},
+            response = await _HTTP.post(
+                "/signals/multi",
+                content=json_dumps({"symbols": missing, "timeframe": "1h"}),
                 timeout=DEFAULT_API_TIMEOUT * 3  # Longer for background checks
             )
             
             if response.status_code == 200:
-                data = response.json()
-                signals = data.get("signals", [])
-                
-                for signal in signals:
-                    symbol = signal['symbol']
-                    current_signal = signal['signal']
-                    
-                    # Skip if error or neutral
-                    if "error" in signal or current_signal == "NEUTRE":
-                        continue
-                        
-                    # Check if signal changed
-                    last_user_signals = last_signals.get(user_id, {})
-                    last_signal = last_user_signals.get(symbol)
-                    
-                    if current_signal != last_signal:
-                        # Send alert
-                        emoji = EMOJI_BUY if "BUY" in current_signal else EMOJI_SELL
-                        msg = f"{EMOJI_ALERT} **ALERTE {symbol}**\n\n{emoji} Nouveau signal: **{current_signal}**\nPrix: ${signal['price']:.2f}\nConfiance: {int(signal['confidence']*100)}%"
-                        await context.bot.send_message(chat_id=user_id, text=msg)
-                        
-                        # Update last signal
-                        if user_id not in last_signals:
-                            last_signals[user_id] = {}
-                        last_signals[user_id][symbol] = current_signal
-                        
+                for signal in json_loads(response.content).get("signals", []):
+                    if "error" not in signal:
+                        by_symbol[signal['symbol']] = signal
+                        cache.set(f"alert_signal_{signal['symbol']}_1h_{bucket}", signal,
+                                  ttl=ALERT_CANDLE_SECONDS * 2)
+            else:
+                print(f"Error fetching signals for alerts: HTTP {response.status_code}")
         except Exception as e:
-            print(f"Error checking alerts for user {user_id}: {e}")
+            print(f"Error fetching signals for alerts: {e}")
+    
+    # Alert text only depends on the symbol: render it once and share it across users
+    alerts_by_symbol = {
+        symbol: (symbol, signal['signal'], _format_alert(signal))
+        for symbol, signal in by_symbol.items()
+        if signal['signal'] != "NEUTRE"
+    }
+    if not alerts_by_symbol:
+        return
+    
+    # Interned watchlists let users with the same symbols share one alert list
+    alerts_by_watchlist = {}
+    for symbols in watchlists.values():
+        if symbols not in alerts_by_watchlist:
+            alerts_by_watchlist[symbols] = [alerts_by_symbol[s] for s in symbols if s in alerts_by_symbol]
+    
+    semaphore = asyncio.Semaphore(ALERT_CHECK_CONCURRENCY)
+    await asyncio.gather(
+        *[_dispatch_user_alerts(context, semaphore, user_id, alerts_by_watchlist[symbols])
+          for user_id, symbols in watchlists.items()],
+        return_exceptions=True
+    )
+    await _flush_last_signals()
 
 def main():
     """Start the bot"""
@@ -351,7 +550,13 @@ def main():
     print("🚀 Démarrage du bot Telegram...")
     
     # Create application
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(_post_init)
+        .post_shutdown(_shutdown)
+        .build()
+    )
     
     # Add command handlers
     application.add_handler(CommandHandler("start", start))
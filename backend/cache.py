@@ -1,42 +1,66 @@
+import threading
 import time
-from typing import Optional, Dict, Any
-from config import settings
+from typing import Optional, Any, Hashable
+from cachetools import TLRUCache
+from config import get_settings
+
+# Import constants
+try:
+    from constants import CACHE_MAX_ENTRIES
+except ImportError:
+    CACHE_MAX_ENTRIES = 10000
+
+settings = get_settings()
+
+# Bound once at import: settings are frozen, and attribute access goes through pydantic
+_DEFAULT_TTL = settings.cache_ttl
+
+
+def _ttu(key: Hashable, entry: tuple, now: float) -> float:
+    """Expiry time for an entry stored as (ttl, value)"""
+    return now + entry[0]
+
 
 class SimpleCache:
-    """Simple in-memory cache with TTL support"""
+    """Simple in-memory cache with TTL support
+    
+    Backed by cachetools.TLRUCache so each key keeps its own TTL, expired
+    entries are evicted on write and the size is bounded by maxsize.
+    """
     
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES, timer=time.monotonic):
+        # Monotonic clock: expiry is unaffected by NTP or manual wall-clock changes
+        self._cache = TLRUCache(maxsize=maxsize, ttu=_ttu, timer=timer)
+        # cachetools is not thread-safe; the cache is shared with worker threads
+        self._lock = threading.Lock()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key in self._cache:
-            entry = self._cache[key]
-            if time.time() < entry["expires_at"]:
-                return entry["value"]
-            else:
-                # Expired, remove it
-                del self._cache[key]
-        return None
+        # Index directly: Cache.get() would check expiry twice (__contains__ then __getitem__)
+        with self._lock:
+            try:
+                _, value = self._cache[key]
+            except KeyError:
+                return None
+        return value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None):
         """Set value in cache with TTL"""
         if ttl is None:
-            ttl = settings.cache_ttl
+            ttl = _DEFAULT_TTL
         
-        self._cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl
-        }
+        with self._lock:
+            self._cache[key] = (ttl, value)
     
     def clear(self):
         """Clear all cache"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
     
-    def delete(self, key: str):
+    def delete(self, key: Hashable):
         """Delete specific key from cache"""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
 
 # Global cache instance
 cache = SimpleCache()
@@ -1,24 +1,27 @@
-import os
-from typing import List
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    # Every field is read from the environment / .env by name (e.g. TELEGRAM_BOT_TOKEN);
+    # secrets have empty defaults and must never be hard-coded here
+    
     # API Configuration
     binance_api_key: str = ""
     binance_secret_key: str = ""
     
     # Telegram Configuration (Required for alerts)
-    telegram_bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-    telegram_chat_id: str = os.getenv("TELEGRAM_CHAT_ID", "")
+    telegram_bot_token: str = ""
+    telegram_chat_id: str = ""
     
     # Trading Configuration
-    default_cryptos: List[str] = [
+    default_cryptos: Tuple[str, ...] = (
         "BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT",
         "ADAUSDT", "DOGEUSDT", "AVAXUSDT", "DOTUSDT", "MATICUSDT",
         "LINKUSDT", "SHIBUSDT"
-    ]
+    )
     default_timeframe: str = "1h"
-    available_timeframes: List[str] = ["15m", "1h", "4h", "1d", "1w"]
+    available_timeframes: Tuple[str, ...] = ("15m", "1h", "4h", "1d", "1w")
     
     # Cache Configuration
     cache_ttl: int = 60  # seconds
@@ -30,19 +33,20 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./crypto_signals.db"
+    signal_retention_days: int = 0  # Prune signals older than this; 0 keeps everything
     
     # API Settings
     api_rate_limit: int = 100  # requests per minute
-    frontend_url: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
-    backend_api_url: str = os.getenv("BACKEND_API_URL", "http://localhost:8000")
+    frontend_url: str = "http://localhost:3000"
+    backend_api_url: str = "http://localhost:8000"
     
     # Sentiment Analysis API Keys (Optional - features disabled if not provided)
-    twitter_bearer_token: str = os.getenv("TWITTER_BEARER_TOKEN", "")
+    twitter_bearer_token: str = ""
     # Reddit API
-    reddit_client_id: str = os.getenv("REDDIT_CLIENT_ID", "")
-    reddit_client_secret: str = os.getenv("REDDIT_CLIENT_SECRET", "")
-    reddit_user_agent: str = os.getenv("REDDIT_USER_AGENT", "CryptoSentimentBot/1.0")
-    news_api_key: str = os.getenv("NEWS_API_KEY", "")
+    reddit_client_id: str = ""
+    reddit_client_secret: str = ""
+    reddit_user_agent: str = "CryptoSentimentBot/1.0"
+    news_api_key: str = ""
     
     # Sentiment Configuration
     sentiment_enabled: bool = True
@@ -55,7 +59,7 @@ class Settings(BaseSettings):
     
     # Ensemble Models
     use_ensemble: bool = True
-    ensemble_models: List[str] = ["xgboost", "random_forest", "lightgbm", "catboost"]
+    ensemble_models: Tuple[str, ...] = ("xgboost", "random_forest", "lightgbm", "catboost")
     ensemble_type: str = "voting"  # voting, stacking, best
     
     # Leverage & Risk Management
@@ -87,9 +91,21 @@ class Settings(BaseSettings):
     outlier_threshold: float = 3.0
     feature_scaling_method: str = "robust"  # standard, robust, minmax
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # defer_build: the validator is only built when settings are first loaded
+    # frozen: settings are read-only, so tuple defaults can be shared as-is
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", defer_build=True, frozen=True
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings on first use and reuse the same instance afterwards"""
+    return Settings()
+
 
-# Global settings instance
-settings = Settings()
+def __getattr__(name):
+    # Keep `from config import settings` working without building Settings at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,25 @@
 Configuration validation and startup checks
 """
 import sys
-from config import settings
+from config import get_settings
 from logger import logger
 
+settings = get_settings()
+
+
+# Optional but recommended settings: (attribute, warning when unset)
+_RECOMMENDED_SETTINGS = (
+    ("telegram_bot_token", "TELEGRAM_BOT_TOKEN not set - Telegram alerts will be disabled"),
+    ("telegram_chat_id", "TELEGRAM_CHAT_ID not set - Telegram alerts will be disabled"),
+)
+
+# Sentiment analysis APIs (all optional): (attributes that must all be set, warning otherwise)
+_SENTIMENT_APIS = (
+    (("twitter_bearer_token",), "TWITTER_BEARER_TOKEN not set - Twitter sentiment disabled"),
+    (("reddit_client_id", "reddit_client_secret"), "REDDIT_CLIENT_ID/SECRET not set - Reddit sentiment disabled"),
+    (("news_api_key",), "NEWS_API_KEY not set - News sentiment disabled"),
+)
+
 
 def validate_required_settings():
     """
@@ -12,34 +28,19 @@ def validate_required_settings():
     Raises ValueError if critical settings are missing
     """
     errors = []
-    warnings = []
     
     # Critical settings (app won't work without these)
     # Note: API keys are optional for basic functionality
     
-    # Optional but recommended settings
-    if not settings.telegram_bot_token:
-        warnings.append("TELEGRAM_BOT_TOKEN not set - Telegram alerts will be disabled")
+    # Each setting is read exactly once
+    warnings = [msg for attr, msg in _RECOMMENDED_SETTINGS if not getattr(settings, attr)]
     
-    if not settings.telegram_chat_id:
-        warnings.append("TELEGRAM_CHAT_ID not set - Telegram alerts will be disabled")
-    
-    # Sentiment analysis APIs (all optional)
     sentiment_apis = 0
-    if settings.twitter_bearer_token:
-        sentiment_apis += 1
-    else:
-        warnings.append("TWITTER_BEARER_TOKEN not set - Twitter sentiment disabled")
-    
-    if settings.reddit_client_id and settings.reddit_client_secret:
-        sentiment_apis += 1
-    else:
-        warnings.append("REDDIT_CLIENT_ID/SECRET not set - Reddit sentiment disabled")
-    
-    if settings.news_api_key:
-        sentiment_apis += 1
-    else:
-        warnings.append("NEWS_API_KEY not set - News sentiment disabled")
+    for attrs, msg in _SENTIMENT_APIS:
+        if all(getattr(settings, attr) for attr in attrs):
+            sentiment_apis += 1
+        else:
+            warnings.append(msg)
     
     if sentiment_apis == 0:
         warnings.append("No sentiment analysis APIs configured - sentiment features disabled")
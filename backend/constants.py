@@ -1,130 +1,174 @@
 """
 Backend Constants
 Centralized constants for the crypto trading backend
+
+Every constant is Final so type checkers (and mypyc, if the backend is ever
+compiled) can treat it as a true constant.
 """
+from typing import Final
 
 # ============================================
 # API & Network
 # ============================================
-DEFAULT_API_TIMEOUT = 10  # seconds
-BINANCE_API_TIMEOUT = 15  # seconds
-TELEGRAM_API_TIMEOUT = 10  # seconds
+DEFAULT_API_TIMEOUT: Final = 10  # seconds
+BINANCE_API_TIMEOUT: Final = 15  # seconds
+TELEGRAM_API_TIMEOUT: Final = 10  # seconds
 
 # Retry configuration
-MAX_RETRIES = 3
-RETRY_BACKOFF_FACTOR = 2  # Exponential backoff: 1s, 2s, 4s
-RETRY_MIN_WAIT = 1  # seconds
-RETRY_MAX_WAIT = 10  # seconds
+MAX_RETRIES: Final = 3
+RETRY_BACKOFF_FACTOR: Final = 2  # Exponential backoff: 1s, 2s, 4s
+RETRY_MIN_WAIT: Final = 1  # seconds
+RETRY_MAX_WAIT: Final = 10  # seconds
+RETRY_STATUS_CODES: Final = (429, 500, 502, 503, 504)  # Transient HTTP statuses worth retrying
+UNRECOVERABLE_STATUS_CODES: Final = (400, 401, 403, 404)  # Bad request/symbol or auth: retrying cannot help
+
+# HTTP connection pooling (keep-alive)
+HTTP_POOL_CONNECTIONS: Final = 16
+HTTP_POOL_MAXSIZE: Final = 32
+KLINES_VALIDATOR_CACHE_SIZE: Final = 256  # Klines URLs whose ETag/Last-Modified are kept for revalidation
 
 # ============================================
 # WebSocket & Real-time Updates
 # ============================================
-WEBSOCKET_UPDATE_INTERVAL = 30  # seconds
-TELEGRAM_ALERT_CHECK_INTERVAL = 3600  # 1 hour in seconds
+WEBSOCKET_UPDATE_INTERVAL: Final = 30  # seconds
+TELEGRAM_ALERT_CHECK_INTERVAL: Final = 3600  # 1 hour in seconds
 
 # ============================================
 # Database
 # ============================================
-DB_POOL_SIZE = 10
-DB_MAX_OVERFLOW = 20
-DB_POOL_PRE_PING = True
+DB_POOL_SIZE: Final = 10
+DB_MAX_OVERFLOW: Final = 20
+DB_WRITE_POOL_SIZE: Final = 1  # SQLite has a single writer: more connections only contend on the lock
+DB_POOL_PRE_PING: Final = True
+DB_POOL_TIMEOUT: Final = 5  # Seconds to wait for a pooled connection before failing
+DB_BUSY_TIMEOUT_MS: Final = 5000  # SQLite waits this long for a lock before SQLITE_BUSY
+DB_CACHE_SIZE_KB: Final = 65536  # SQLite page cache per connection
+
+# Signal write-behind batching
+SIGNAL_WRITE_BATCH_SIZE: Final = 500
+SIGNAL_WRITE_FLUSH_INTERVAL: Final = 0.2  # seconds
+SIGNAL_PRUNE_BATCH_SIZE: Final = 5000  # rows deleted per transaction when pruning
+SIGNAL_PRUNE_INTERVAL: Final = 86400  # seconds between retention passes
 
 # Query limits
-DEFAULT_QUERY_LIMIT = 100
-MAX_QUERY_LIMIT = 1000
-DEFAULT_QUERY_OFFSET = 0
+DEFAULT_QUERY_LIMIT: Final = 100
+MAX_QUERY_LIMIT: Final = 1000
+DEFAULT_QUERY_OFFSET: Final = 0
 
 # ============================================
 # Cache
 # ============================================
-DEFAULT_CACHE_TTL = 60  # seconds
-SENTIMENT_CACHE_TTL = 3600  # 1 hour
-MODEL_CACHE_TTL = 86400  # 24 hours
+DEFAULT_CACHE_TTL: Final = 60  # seconds
+SENTIMENT_CACHE_TTL: Final = 3600  # 1 hour
+MODEL_CACHE_TTL: Final = 86400  # 24 hours
+CACHE_MAX_ENTRIES: Final = 10000  # Bound on the shared in-memory cache
+HISTORY_CACHE_TTL: Final = 2.0  # seconds; absorbs dashboard polling of identical history pages
+HISTORY_CACHE_SIZE: Final = 512
 
 # ============================================
 # ML & Predictions
 # ============================================
-MIN_DATA_POINTS = 50  # Minimum candles needed for prediction
-MODEL_LOAD_TIMEOUT = 30  # seconds
-PREDICTION_TIMEOUT = 5  # seconds
+MIN_DATA_POINTS: Final = 50  # Minimum candles needed for prediction
+MODEL_LOAD_TIMEOUT: Final = 30  # seconds
+PREDICTION_TIMEOUT: Final = 5  # seconds
+SENTIMENT_TIMEOUT: Final = 5  # seconds a signal waits for its sentiment score
+SENTIMENT_WORKERS: Final = 4  # Background sentiment fetches overlapping indicator math
 
 # Fallback heuristic weights
-HEURISTIC_WEIGHT_EMA = 0.3
-HEURISTIC_WEIGHT_RSI = 0.25
-HEURISTIC_WEIGHT_MACD = 0.25
-HEURISTIC_WEIGHT_VOLUME = 0.2
+HEURISTIC_WEIGHT_EMA: Final = 0.3
+HEURISTIC_WEIGHT_RSI: Final = 0.25
+HEURISTIC_WEIGHT_MACD: Final = 0.25
+HEURISTIC_WEIGHT_VOLUME: Final = 0.2
 
 # ============================================
 # Rate Limiting
 # ============================================
-RATE_LIMIT_SIGNAL = "10/minute"
-RATE_LIMIT_MULTI_SIGNAL = "30/minute"
-RATE_LIMIT_BACKTEST = "2/minute"
-RATE_LIMIT_HISTORY = "20/minute"
+RATE_LIMIT_SIGNAL: Final = "10/minute"
+RATE_LIMIT_MULTI_SIGNAL: Final = "30/minute"
+RATE_LIMIT_BACKTEST: Final = "2/minute"
+RATE_LIMIT_HISTORY: Final = "20/minute"
 
 # Binance API rate limits (per minute)
-BINANCE_RATE_LIMIT_WEIGHT = 1200
-BINANCE_RATE_LIMIT_ORDERS = 50
+BINANCE_RATE_LIMIT_WEIGHT: Final = 1200
+BINANCE_RATE_LIMIT_ORDERS: Final = 50
 
 # ============================================
 # Backtest
 # ============================================
-DEFAULT_BACKTEST_DAYS = 30
-MAX_BACKTEST_DAYS = 90
-MIN_BACKTEST_DAYS = 7
+DEFAULT_BACKTEST_DAYS: Final = 30
+MAX_BACKTEST_DAYS: Final = 90
+MIN_BACKTEST_DAYS: Final = 7
 
 # ============================================
 # Logging
 # ============================================
-LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
-LOG_BACKUP_COUNT = 5
-LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_MAX_BYTES: Final = 10 * 1024 * 1024  # 10 MB
+LOG_BACKUP_COUNT: Final = 5
+LOG_DATE_FORMAT: Final = '%Y-%m-%d %H:%M:%S'
 
 # ============================================
 # Error Messages
 # ============================================
-ERROR_INSUFFICIENT_DATA = "Insufficient data for analysis"
-ERROR_BINANCE_API = "Binance API error"
-ERROR_MODEL_NOT_FOUND = "ML model not found"
-ERROR_PREDICTION_FAILED = "Prediction failed"
-ERROR_INVALID_SYMBOL = "Invalid symbol"
-ERROR_INVALID_TIMEFRAME = "Invalid timeframe"
-ERROR_DATABASE = "Database error"
-ERROR_TELEGRAM = "Telegram notification error"
+ERROR_INSUFFICIENT_DATA: Final = "Insufficient data for analysis"
+ERROR_BINANCE_API: Final = "Binance API error"
+ERROR_MODEL_NOT_FOUND: Final = "ML model not found"
+ERROR_PREDICTION_FAILED: Final = "Prediction failed"
+ERROR_INVALID_SYMBOL: Final = "Invalid symbol"
+ERROR_INVALID_TIMEFRAME: Final = "Invalid timeframe"
+ERROR_DATABASE: Final = "Database error"
+ERROR_TELEGRAM: Final = "Telegram notification error"
 
 # ============================================
 # Success Messages
 # ============================================
-SUCCESS_SIGNAL_GENERATED = "Signal generated successfully"
-SUCCESS_MODEL_LOADED = "Model loaded successfully"
-SUCCESS_SETTINGS_UPDATED = "Settings updated successfully"
+SUCCESS_SIGNAL_GENERATED: Final = "Signal generated successfully"
+SUCCESS_MODEL_LOADED: Final = "Model loaded successfully"
+SUCCESS_SETTINGS_UPDATED: Final = "Settings updated successfully"
 
 # ============================================
 # Telegram Bot
 # ============================================
-TELEGRAM_MAX_MESSAGE_LENGTH = 4096
-TELEGRAM_RETRY_ATTEMPTS = 3
-TELEGRAM_RETRY_DELAY = 2  # seconds
+TELEGRAM_MAX_MESSAGE_LENGTH: Final = 4096
+TELEGRAM_RETRY_ATTEMPTS: Final = 3
+TELEGRAM_RETRY_DELAY: Final = 2  # seconds
+SIGNAL_FETCH_WORKERS: Final = 8  # Parallel signal generations per alert cycle
+ALERT_CHECK_CONCURRENCY: Final = 16  # Concurrent Telegram sends in check_alerts
+ALERT_CANDLE_SECONDS: Final = 3600  # Alert signals are reused until the next 1h candle
+ALERT_MISFIRE_GRACE: Final = 60  # Seconds a late alert tick may run before it is skipped
+MAX_WATCHLIST: Final = 50  # Maximum symbols per Telegram watchlist
 
 # ============================================
 # Data Validation
 # ============================================
-MIN_PRICE = 0.00000001  # Minimum valid price
-MAX_PRICE = 1000000000  # Maximum valid price
-MIN_VOLUME = 0
-MAX_RSI = 100
-MIN_RSI = 0
+MIN_PRICE: Final = 0.00000001  # Minimum valid price
+MAX_PRICE: Final = 1000000000  # Maximum valid price
+MIN_VOLUME: Final = 0
+MAX_RSI: Final = 100
+MIN_RSI: Final = 0
 
 # ============================================
 # Signal Emojis
 # ============================================
-EMOJI_BUY = "🟢"
-EMOJI_SELL = "🔴"
-EMOJI_NEUTRAL = "⚪"
-EMOJI_ALERT = "🚨"
-EMOJI_SUCCESS = "✅"
-EMOJI_ERROR = "❌"
-EMOJI_WARNING = "⚠️"
-EMOJI_INFO = "ℹ️"
-EMOJI_CHART = "📊"
-EMOJI_ROCKET = "🚀"
+EMOJI_BUY: Final = "🟢"
+EMOJI_SELL: Final = "🔴"
+EMOJI_NEUTRAL: Final = "⚪"
+EMOJI_ALERT: Final = "🚨"
+EMOJI_SUCCESS: Final = "✅"
+EMOJI_ERROR: Final = "❌"
+EMOJI_WARNING: Final = "⚠️"
+EMOJI_INFO: Final = "ℹ️"
+EMOJI_CHART: Final = "📊"
+EMOJI_ROCKET: Final = "🚀"
+
+# Signal -> emoji lookup (single source of truth for BUY/SELL classification)
+SIGNAL_EMOJI: Final = {
+    "BUY": EMOJI_BUY,
+    "BUY (Trend)": EMOJI_BUY,
+    "BUY (Weak)": EMOJI_BUY,
+    "STRONG_BUY": EMOJI_BUY,
+    "SELL": EMOJI_SELL,
+    "SELL (Trend)": EMOJI_SELL,
+    "SELL (Weak)": EMOJI_SELL,
+    "STRONG_SELL": EMOJI_SELL,
+    "NEUTRE": EMOJI_NEUTRAL,
+}
@@ -1,19 +1,36 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
+import functools
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from cachetools import TTLCache
+from sqlalchemy import create_engine, event, insert, inspect, select, tuple_, Column, Integer, BigInteger, String, Float, DateTime, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.exc import IntegrityError, OperationalError
-from datetime import datetime
-from config import settings
+from datetime import datetime, timedelta
+from config import get_settings
 from logger import logger
 
 # Import constants
 try:
-    from constants import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING
+    from constants import (
+        DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_BUSY_TIMEOUT_MS, DB_CACHE_SIZE_KB, DB_WRITE_POOL_SIZE,
+        DB_POOL_TIMEOUT, HISTORY_CACHE_TTL, HISTORY_CACHE_SIZE, SIGNAL_PRUNE_BATCH_SIZE
+    )
     from exceptions import DatabaseError, DatabaseConnectionError, DuplicateSignalError
 except ImportError:
     DB_POOL_SIZE = 10
     DB_MAX_OVERFLOW = 20
     DB_POOL_PRE_PING = True
+    DB_BUSY_TIMEOUT_MS = 5000
+    DB_CACHE_SIZE_KB = 65536
+    DB_WRITE_POOL_SIZE = 1
+    DB_POOL_TIMEOUT = 5
+    HISTORY_CACHE_TTL = 2.0
+    HISTORY_CACHE_SIZE = 512
+    SIGNAL_PRUNE_BATCH_SIZE = 5000
     
     class DatabaseError(Exception): pass
     class DatabaseConnectionError(Exception): pass
@@ -25,12 +42,17 @@ class Signal(Base):
     __tablename__ = "signals"
     __table_args__ = (
         # Composite index for common queries (symbol + timestamp)
-        # This speeds up queries like "get recent signals for BTC"
+        # "recent signals for BTC" becomes an index range scan that stops at LIMIT;
+        # its symbol prefix also serves symbol-only queries
+        Index('ix_signals_symbol_ts', 'symbol', 'timestamp'),
+        # One signal per symbol/timeframe/candle: INSERT OR IGNORE dedupes on it.
+        # A unique index rather than a constraint so it can be added to existing tables
+        Index('uq_signal_candle', 'symbol', 'timeframe', 'candle_time', unique=True),
         {'extend_existing': True}
     )
     
     id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String, index=True)  # Individual index for symbol-only queries
+    symbol = Column(String)
     timeframe = Column(String)
     signal = Column(String, index=True)  # Index for filtering by signal type
     confidence = Column(Float)
@@ -39,7 +61,29 @@ class Signal(Base):
     ema20 = Column(Float)
     ema50 = Column(Float)
     macd = Column(Float)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)  # Individual index for time-based queries
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)  # History without a symbol filter
+    candle_time = Column(BigInteger)  # Open time (ms) of the candle the signal was computed on
+
+@dataclass(slots=True)
+class SignalRow:
+    """Plain read-only view of a Signal row for history reads (no ORM instrumentation)"""
+    id: int
+    symbol: str
+    timeframe: str
+    signal: str
+    confidence: float
+    price: float
+    rsi: float
+    ema20: float
+    ema50: float
+    macd: float
+    timestamp: datetime
+
+# Columns selected for SignalRow, in field order
+_SIGNAL_ROW_COLUMNS = (
+    Signal.id, Signal.symbol, Signal.timeframe, Signal.signal, Signal.confidence, Signal.price,
+    Signal.rsi, Signal.ema20, Signal.ema50, Signal.macd, Signal.timestamp
+)
 
 class Settings(Base):
     __tablename__ = "settings"
@@ -96,10 +140,14 @@ class SessionPosition(Base):
 class SessionTrade(Base):
     """Executed trade in a trading session"""
     __tablename__ = "session_trades"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Latest trades of a session; the session_id prefix also serves deletes by session
+        Index('ix_session_trades_session_ts', 'session_id', 'timestamp'),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, index=True)
+    session_id = Column(String)
     symbol = Column(String, index=True)
     trade_type = Column(String)  # BUY or SELL
     price = Column(Float)
@@ -107,28 +155,158 @@ class SessionTrade(Base):
     confidence = Column(Float)
     signal_reason = Column(String)  # BUY, SELL, STOP_LOSS, TAKE_PROFIT
     pnl = Column(Float, default=0.0)  # Only for SELL trades
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow)
 
-# Create engine with connection pooling
-try:
-    engine = create_engine(
-        settings.database_url,
-        connect_args={"check_same_thread": False},  # Needed for SQLite
-        pool_size=DB_POOL_SIZE,
-        max_overflow=DB_MAX_OVERFLOW,
-        pool_pre_ping=DB_POOL_PRE_PING,  # Verify connections before using
-        echo=False  # Set to True for SQL debugging
+
+class UserWatchlist(Base):
+    """Symbol watched by a Telegram user - survives bot restarts"""
+    __tablename__ = "user_watchlists"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'symbol', name='uq_user_watchlist'),
+        {'extend_existing': True}
     )
-    logger.info(f"Database engine created with pool_size={DB_POOL_SIZE}, max_overflow={DB_MAX_OVERFLOW}")
-except Exception as e:
-    logger.error(f"Failed to create database engine: {e}")
-    raise DatabaseConnectionError(f"Failed to create database engine: {e}")
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(BigInteger, index=True)  # Telegram ids exceed 32 bits
+    symbol = Column(String)
+
+
+class UserLastSignal(Base):
+    """Last signal alerted to a Telegram user for a symbol (alert dedup)"""
+    __tablename__ = "user_last_signals"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'symbol', name='uq_user_last_signal'),
+        {'extend_existing': True}
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(BigInteger, index=True)
+    symbol = Column(String)
+    signal = Column(String)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+def _create_engine(pool_size: int, max_overflow: int):
+    """Create an engine on the configured database with connection pooling"""
+    try:
+        new_engine = create_engine(
+            get_settings().database_url,
+            connect_args={"check_same_thread": False},  # Needed for SQLite
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=DB_POOL_PRE_PING,  # Verify connections before using
+            pool_timeout=DB_POOL_TIMEOUT,  # Fail fast instead of queueing behind a stuck writer
+            echo=False  # Set to True for SQL debugging
+        )
+        logger.info(f"Database engine created with pool_size={pool_size}, max_overflow={max_overflow}")
+        return new_engine
+    except Exception as e:
+        logger.error(f"Failed to create database engine: {e}")
+        raise DatabaseConnectionError(f"Failed to create database engine: {e}")
+
+def _attach_sqlite_pragmas(target, query_only: bool = False):
+    """Tune every new SQLite connection of an engine (no-op on other dialects)"""
+    if target.dialect.name != "sqlite":
+        return
+    in_memory = target.url.database in (None, "", ":memory:")
+    
+    @event.listens_for(target, "connect")
+    def _sqlite_pragmas(dbapi_conn, _):
+        """
+        WAL journal: commits append instead of fsyncing, and readers don't block the writer
+        
+        busy_timeout makes a locked writer wait instead of failing with SQLITE_BUSY.
+        In-memory databases have no journal file, so WAL is skipped for them.
+        """
+        cursor = dbapi_conn.cursor()
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+def _use_immediate_transactions(target):
+    """
+    Open write transactions of a SQLite engine with BEGIN IMMEDIATE
+    
+    pysqlite's own deferred BEGIN is disabled so SQLAlchemy emits the BEGIN.
+    Connections carrying the sqlite_immediate execution option take the write
+    lock up front, so concurrent writers wait on busy_timeout instead of failing
+    with SQLITE_BUSY on their first write; every other transaction stays deferred
+    and does not hold the lock while it only reads.
+    """
+    @event.listens_for(target, "connect")
+    def _disable_pysqlite_begin(dbapi_conn, _):
+        dbapi_conn.isolation_level = None
+    
+    @event.listens_for(target, "begin")
+    def _begin(conn):
+        if conn.get_execution_options().get("sqlite_immediate"):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
+# SQLite allows a single writer even in WAL mode: on SQLite writes go through a
+# one-connection pool so they queue in-process instead of contending on the file
+# lock, while reads get their own pool of query_only connections.
+if get_settings().database_url.startswith("sqlite") and ":memory:" not in get_settings().database_url:
+    engine = _create_engine(DB_WRITE_POOL_SIZE, 0)
+    read_engine = _create_engine(DB_POOL_SIZE, DB_MAX_OVERFLOW)
+    _attach_sqlite_pragmas(engine)
+    _use_immediate_transactions(engine)
+    _attach_sqlite_pragmas(read_engine, query_only=True)
+else:
+    engine = read_engine = _create_engine(DB_POOL_SIZE, DB_MAX_OVERFLOW)
+    _attach_sqlite_pragmas(engine)
+
+# Same pool as engine, for transactions that are known to write
+write_engine = engine.execution_options(sqlite_immediate=True)
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+# create_all skips existing tables: add new columns and the composite indexes to
+# older databases and drop the indexes they supersede
+with engine.begin() as _conn:
+    if "candle_time" not in {column["name"] for column in inspect(_conn).get_columns("signals")}:
+        _conn.exec_driver_sql("ALTER TABLE signals ADD COLUMN candle_time BIGINT")
+for _index in (*Signal.__table__.indexes, *SessionTrade.__table__.indexes):
+    if _index.name.endswith("_ts") or _index.name == "uq_signal_candle":
+        try:
+            _index.create(bind=engine, checkfirst=True)
+        except IntegrityError as e:
+            logger.warning(f"Could not create {_index.name}, existing rows are duplicated: {e}")
+with engine.begin() as _conn:
+    for _name in ("ix_signals_symbol", "ix_session_trades_session_id", "ix_session_trades_timestamp", "uq_signal_st"):
+        _conn.exec_driver_sql(f"DROP INDEX IF EXISTS {_name}")
+
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects stay populated after commit, so returning or
+# serializing them does not trigger a fresh SELECT per attribute
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+ReadSession = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
+
+# Long-lived per-thread sessions for the db_op helpers: the Session object is
+# reused across calls and only its transaction is opened and closed each time
+_writer_session = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=write_engine)
+)
+_reader_session = scoped_session(ReadSession)
+
+@contextmanager
+def ro_conn():
+    """
+    Read-only connection in autocommit mode
+    
+    Skips the implicit BEGIN/ROLLBACK pair a Session wraps around every read.
+    """
+    with read_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        yield conn
 
 def get_db():
     """Dependency for FastAPI"""
@@ -138,100 +316,305 @@ def get_db():
     finally:
         db.close()
 
-def save_signal(signal_data: dict):
-    """Save signal to database with error handling"""
-    db = SessionLocal()
+def get_read_db():
+    """Dependency for FastAPI read-only endpoints"""
+    db = ReadSession()
     try:
-        signal = Signal(
-            symbol=signal_data["symbol"],
-            timeframe=signal_data["timeframe"],
-            signal=signal_data["signal"],
-            confidence=signal_data["confidence"],
-            price=signal_data["price"],
-            rsi=signal_data["indicators"]["rsi"],
-            ema20=signal_data["indicators"]["ema20"],
-            ema50=signal_data["indicators"]["ema50"],
-            macd=signal_data["indicators"]["macd"]
-        )
-        db.add(signal)
-        db.commit()
-        db.refresh(signal)
-        logger.debug(f"Saved signal for {signal_data['symbol']}: {signal_data['signal']}")
-        return signal
-    except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error saving signal: {e}")
-        raise DuplicateSignalError(f"Signal already exists: {e}")
-    except OperationalError as e:
-        db.rollback()
-        logger.error(f"Database operational error: {e}")
-        raise DatabaseConnectionError(f"Database connection error: {e}")
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Unexpected error saving signal: {e}")
-        raise DatabaseError(f"Failed to save signal: {e}")
+        yield db
     finally:
         db.close()
 
-def get_signal_history(symbol: str = None, limit: int = 100, offset: int = 0):
-    """Get signal history from database with pagination and error handling"""
-    db = SessionLocal()
-    try:
-        query = db.query(Signal)
-        if symbol:
-            query = query.filter(Signal.symbol == symbol)
-        signals = query.order_by(Signal.timestamp.desc()).offset(offset).limit(limit).all()
-        logger.debug(f"Retrieved {len(signals)} signals from history")
-        return signals
-    except OperationalError as e:
-        logger.error(f"Database operational error retrieving history: {e}")
-        raise DatabaseConnectionError(f"Database connection error: {e}")
-    except Exception as e:
-        logger.error(f"Error retrieving signal history: {e}")
-        raise DatabaseError(f"Failed to retrieve signals: {e}")
-    finally:
-        db.close()
+def db_op(action: str, session: bool = True, readonly: bool = False, integrity_error=DatabaseError):
+    """
+    Shared error handling for DB helpers
+    
+    With session=True the helper receives this thread's long-lived Session as
+    first argument (the reader one when readonly=True), rolled back on error and
+    always closed so no transaction or identity map outlives the call. SQLAlchemy errors are logged and
+    re-raised as the backend's typed database exceptions.
+    
+    Args:
+        action: What the helper does, used in log and error messages
+        session: Whether to open and inject a Session
+        readonly: Whether the injected Session only reads
+        integrity_error: Exception raised on IntegrityError
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            db = (_reader_session() if readonly else _writer_session()) if session else None
+            try:
+                if db is None:
+                    return fn(*args, **kwargs)
+                return fn(db, *args, **kwargs)
+            except DatabaseError:
+                if db is not None:
+                    db.rollback()
+                raise
+            except IntegrityError as e:
+                if db is not None:
+                    db.rollback()
+                logger.error(f"Integrity error while trying to {action}: {e}")
+                raise integrity_error(f"Failed to {action}: {e}")
+            except OperationalError as e:
+                if db is not None:
+                    db.rollback()
+                logger.error(f"Database operational error while trying to {action}: {e}")
+                raise DatabaseConnectionError(f"Database connection error: {e}")
+            except Exception as e:
+                if db is not None:
+                    db.rollback()
+                logger.error(f"Unexpected error while trying to {action}: {e}")
+                raise DatabaseError(f"Failed to {action}: {e}")
+            finally:
+                if db is not None:
+                    db.close()
+        return wrapper
+    return decorator
+
+def save_signal(signal_data: dict):
+    """Save signal to database with error handling"""
+    if not save_signals_bulk([signal_data]):
+        raise DuplicateSignalError(f"Signal already stored for {signal_data['symbol']}")
+
+@db_op("save signals", session=False, integrity_error=DuplicateSignalError)
+def save_signals_bulk(rows: list) -> int:
+    """
+    Save many signals with a single Core INSERT and one commit
+    
+    On SQLite the INSERT is prefixed with OR IGNORE so a signal for a candle
+    already stored (same symbol, timeframe and candle open time) is skipped by
+    the engine instead of aborting the batch.
+    
+    Args:
+        rows: Signal dicts as returned by generate_signal
+        
+    Returns:
+        Number of rows actually inserted
+    """
+    if not rows:
+        return 0
+    # One clock read per batch instead of the per-row Python default callback
+    now = datetime.utcnow()
+    flat_rows = [
+        {
+            "timestamp": now,
+            "candle_time": row.get("timestamp"),
+            "symbol": row["symbol"],
+            "timeframe": row["timeframe"],
+            "signal": row["signal"],
+            "confidence": row["confidence"],
+            "price": row["price"],
+            "rsi": row["indicators"]["rsi"],
+            "ema20": row["indicators"]["ema20"],
+            "ema50": row["indicators"]["ema50"],
+            "macd": row["indicators"]["macd"]
+        }
+        for row in rows
+    ]
+    stmt = insert(Signal).prefix_with("OR IGNORE", dialect="sqlite")
+    with write_engine.begin() as conn:
+        inserted = conn.execute(stmt, flat_rows).rowcount
+    if inserted:
+        _invalidate_history_cache()
+    if inserted < len(flat_rows):
+        logger.warning("Skipped %d duplicate signal(s)", len(flat_rows) - inserted)
+    logger.debug("Saved %d signal(s)", inserted)
+    return inserted
+
+# Short-lived cache of history pages. The version is part of the key, so a
+# write makes every older entry unreachable until it ages out.
+_history_cache = TTLCache(maxsize=HISTORY_CACHE_SIZE, ttl=HISTORY_CACHE_TTL)
+_history_version = 0
+_history_lock = threading.Lock()
 
+def _invalidate_history_cache():
+    """Make cached history pages stale after new signals are written"""
+    global _history_version
+    with _history_lock:
+        _history_version += 1
+
+@db_op("retrieve signal history", session=False)
+def get_signal_history(symbol: str = None, limit: int = 100, offset: int = 0,
+                       before_ts: datetime = None, before_id: int = None):
+    """
+    Get signal history from database with pagination and error handling
+    
+    Pass the (timestamp, id) of the last row of the previous page as
+    before_ts/before_id for keyset pagination: the query seeks straight into
+    the (symbol, timestamp) index instead of scanning and discarding
+    `offset` rows.
+    """
+    key = (symbol, limit, offset, before_ts, before_id)
+    with _history_lock:
+        version = _history_version
+        cached = _history_cache.get((version, key))
+    if cached is not None:
+        return list(cached)
+    
+    query = select(*_SIGNAL_ROW_COLUMNS)
+    if symbol:
+        query = query.where(Signal.symbol == symbol)
+    if before_ts is not None:
+        query = query.where(tuple_(Signal.timestamp, Signal.id) < (before_ts, before_id or 0))
+    elif offset:
+        query = query.offset(offset)
+    query = query.order_by(Signal.timestamp.desc(), Signal.id.desc()).limit(limit)
+    with ro_conn() as conn:
+        signals = [SignalRow(*row) for row in conn.execute(query)]
+    logger.debug("Retrieved %d signals from history", len(signals))
+    with _history_lock:
+        _history_cache[(version, key)] = tuple(signals)
+    return signals
+
+@db_op("prune signals", session=False)
+def prune_signals(retention_days: int, batch_size: int = SIGNAL_PRUNE_BATCH_SIZE) -> int:
+    """
+    Delete signals older than retention_days in small batches
+    
+    Ids grow with timestamps, so each batch is a short rowid-order scan from
+    the oldest row; SQLite reuses the freed pages for new signals, which keeps
+    the file bounded without a VACUUM.
+    
+    Returns:
+        Number of rows deleted
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    oldest = (
+        select(Signal.id)
+        .where(Signal.timestamp < cutoff)
+        .order_by(Signal.id)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    stmt = Signal.__table__.delete().where(Signal.id.in_(oldest))
+    
+    deleted = 0
+    while True:
+        with write_engine.begin() as conn:
+            count = conn.execute(stmt).rowcount
+        deleted += count
+        if count < batch_size:
+            break
+    if deleted:
+        _invalidate_history_cache()
+        logger.info("Pruned %d signal(s) older than %d days", deleted, retention_days)
+    return deleted
+
+# In-process copy of the settings table; invalidated by update_setting.
+# The version guards against storing a load that raced with a write.
+_settings_cache = None
+_settings_version = 0
+_settings_lock = threading.Lock()
+
+@db_op("retrieve settings", session=False)
 def get_settings_from_db():
     """Get all settings as a dict with error handling"""
-    db = SessionLocal()
-    try:
-        settings_list = db.query(Settings).all()
-        return {s.key: s.value for s in settings_list}
-    except OperationalError as e:
-        logger.error(f"Database operational error retrieving settings: {e}")
-        raise DatabaseConnectionError(f"Database connection error: {e}")
-    except Exception as e:
-        logger.error(f"Error retrieving settings: {e}")
-        raise DatabaseError(f"Failed to retrieve settings: {e}")
-    finally:
-        db.close()
+    global _settings_cache
+    with _settings_lock:
+        if _settings_cache is not None:
+            return dict(_settings_cache)
+        version = _settings_version
+    
+    with ro_conn() as conn:
+        loaded = dict(conn.execute(select(Settings.key, Settings.value)).all())
+    with _settings_lock:
+        if _settings_version == version:
+            _settings_cache = loaded
+    return dict(loaded)
+
+def _invalidate_settings_cache():
+    """Drop the cached settings so the next read reloads them"""
+    global _settings_cache, _settings_version
+    with _settings_lock:
+        _settings_cache = None
+        _settings_version += 1
 
-def update_setting(key: str, value: str):
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+@db_op("update setting")
+def update_setting(db, key: str, value: str):
     """Update or create a setting with error handling"""
-    db = SessionLocal()
-    try:
+    value = str(value)
+    upsert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        # One statement: no SELECT round-trip and no insert race on the key;
+        # the WHERE skips the UPDATE (and the write) when the value is unchanged
+        stmt = upsert(Settings).values(key=key, value=value)
+        changed = db.execute(stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value},
+            where=Settings.value.is_distinct_from(stmt.excluded.value)
+        )).rowcount
+    else:
         setting = db.query(Settings).filter(Settings.key == key).first()
+        changed = not setting or setting.value != value
         if not setting:
-            setting = Settings(key=key, value=str(value))
-            db.add(setting)
-            logger.debug(f"Created new setting: {key}")
+            db.add(Settings(key=key, value=value))
+        elif changed:
+            setting.value = value
+    if not changed:
+        return
+    db.commit()
+    _invalidate_settings_cache()
+    logger.debug("Saved setting: %s", key)
+
+@db_op("retrieve watchlists", readonly=True)
+def get_user_watchlists(db):
+    """Get all Telegram watchlists as {user_id: set(symbols)} with error handling"""
+    watchlists = {}
+    for entry in db.query(UserWatchlist).all():
+        watchlists.setdefault(entry.user_id, set()).add(entry.symbol)
+    return watchlists
+
+@db_op("update watchlist")
+def add_watchlist_symbols(db, user_id: int, symbols):
+    """Add symbols to a user's watchlist, ignoring ones already watched"""
+    existing = {
+        row.symbol for row in
+        db.query(UserWatchlist.symbol).filter(UserWatchlist.user_id == user_id)
+    }
+    for symbol in set(symbols) - existing:
+        db.add(UserWatchlist(user_id=user_id, symbol=symbol))
+    db.commit()
+
+@db_op("update watchlist")
+def remove_watchlist_symbols(db, user_id: int, symbols):
+    """Remove symbols from a user's watchlist"""
+    db.query(UserWatchlist).filter(
+        UserWatchlist.user_id == user_id,
+        UserWatchlist.symbol.in_(list(symbols))
+    ).delete(synchronize_session=False)
+    db.commit()
+
+@db_op("retrieve last signals", readonly=True)
+def get_last_signals(db):
+    """Get last alerted signals as {user_id: {symbol: signal}} with error handling"""
+    last = {}
+    for entry in db.query(UserLastSignal).all():
+        last.setdefault(entry.user_id, {})[entry.symbol] = entry.signal
+    return last
+
+@db_op("save last signals")
+def save_last_signals(db, entries):
+    """
+    Upsert many (user_id, symbol, signal) last alerted signals in one transaction
+    
+    Used by the Telegram bot to flush a whole alert tick with a single commit.
+    """
+    if not entries:
+        return
+    latest = {(user_id, symbol): signal for user_id, symbol, signal in entries}
+    user_ids = {user_id for user_id, _ in latest}
+    existing = {
+        (entry.user_id, entry.symbol): entry
+        for entry in db.query(UserLastSignal).filter(UserLastSignal.user_id.in_(user_ids))
+    }
+    for (user_id, symbol), signal in latest.items():
+        entry = existing.get((user_id, symbol))
+        if not entry:
+            db.add(UserLastSignal(user_id=user_id, symbol=symbol, signal=signal))
         else:
-            setting.value = str(value)
-            logger.debug(f"Updated setting: {key}")
-        db.commit()
-        return setting
-    except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Integrity error updating setting {key}: {e}")
-        raise DatabaseError(f"Failed to update setting: {e}")
-    except OperationalError as e:
-        db.rollback()
-        logger.error(f"Database operational error updating setting: {e}")
-        raise DatabaseConnectionError(f"Database connection error: {e}")
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error updating setting {key}: {e}")
-        raise DatabaseError(f"Failed to update setting: {e}")
-    finally:
-        db.close()
+            entry.signal = signal
+    db.commit()
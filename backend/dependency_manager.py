@@ -5,10 +5,64 @@ Handles missing optional dependencies and provides fallback mechanisms
 
 import importlib
 import sys
-from typing import Dict, List, Optional, Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Optional, Callable, Any, Mapping, Tuple
 from logger import logger
 
 
+# Import name -> pip package
+_DEPENDENCIES: Mapping[str, str] = MappingProxyType({
+    "textblob": "textblob",
+    "tweepy": "tweepy", 
+    "praw": "praw",
+    "newsapi": "newsapi-python",
+    "requests": "requests",
+    "pandas": "pandas",
+    "numpy": "numpy",
+    "ta": "ta",
+    "joblib": "joblib",
+    "sklearn": "scikit-learn"
+})
+
+_OPTIONAL_DEPENDENCIES = frozenset({"textblob", "tweepy", "praw", "newsapi"})
+
+# Feature name -> dependencies it needs
+_FEATURE_DEPENDENCIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "sentiment_analysis": ("textblob",),
+    "twitter_sentiment": ("tweepy", "textblob"),
+    "reddit_sentiment": ("praw", "textblob"),
+    "news_sentiment": ("newsapi", "textblob"),
+    "ml_prediction": ("pandas", "numpy", "sklearn", "joblib"),
+    "technical_analysis": ("ta", "pandas", "numpy")
+})
+
+_INSTALL_INSTRUCTIONS: Mapping[str, str] = MappingProxyType({
+    "textblob": "pip install textblob && python -m textblob.download_corpora",
+    "tweepy": "pip install tweepy",
+    "praw": "pip install praw",
+    "newsapi": "pip install newsapi-python",
+    "requests": "pip install requests",
+    "pandas": "pip install pandas",
+    "numpy": "pip install numpy",
+    "ta": "pip install ta",
+    "joblib": "pip install joblib",
+    "sklearn": "pip install scikit-learn"
+})
+
+
+_IMPORT_WORKERS = 4
+
+
+def _try_import(module_name: str) -> Optional[ImportError]:
+    """Import a module, returning the ImportError instead of raising it"""
+    try:
+        importlib.import_module(module_name)
+        return None
+    except ImportError as e:
+        return e
+
+
 class DependencyStatus:
     """Status of dependency validation"""
     
@@ -26,6 +80,8 @@ class DependencyManager:
     
     def __init__(self):
         self.status = DependencyStatus()
+        self._validated = False
+        self._feature_cache: Dict[str, bool] = {}
         self._setup_fallbacks()
     
     def _setup_fallbacks(self):
@@ -49,37 +105,43 @@ class DependencyManager:
             "news_api": lambda *args, **kwargs: {"articles": [], "sentiment": 0.0}
         }
     
-    def validate_dependencies(self) -> DependencyStatus:
+    def validate_dependencies(self, force: bool = False) -> DependencyStatus:
         """
         Validate all optional dependencies
         
+        Runs once; later calls return the first result unless force=True.
+        
+        Args:
+            force: Re-run the import checks
+        
         Returns:
             DependencyStatus with validation results
         """
-        dependencies = {
-            "textblob": "textblob",
-            "tweepy": "tweepy", 
-            "praw": "praw",
-            "newsapi": "newsapi-python",
-            "requests": "requests",
-            "pandas": "pandas",
-            "numpy": "numpy",
-            "ta": "ta",
-            "joblib": "joblib",
-            "sklearn": "scikit-learn"
-        }
+        if self._validated and not force:
+            return self.status
+        
+        self.status.available.clear()
+        self.status.missing.clear()
+        self.status.errors.clear()
+        self._feature_cache.clear()
         
-        for dep_name, package_name in dependencies.items():
-            try:
-                importlib.import_module(dep_name)
+        # Imports are mostly file I/O, so the slow ones (pandas, sklearn) overlap;
+        # results are applied in table order so status stays deterministic
+        pending = [name for name in _DEPENDENCIES if name not in sys.modules]
+        with ThreadPoolExecutor(max_workers=max(1, min(_IMPORT_WORKERS, len(pending)))) as executor:
+            import_errors = dict(zip(pending, executor.map(_try_import, pending)))
+        
+        for dep_name, package_name in _DEPENDENCIES.items():
+            error = import_errors.get(dep_name)
+            if error is None:
                 self.status.available[dep_name] = True
                 logger.debug(f"✅ Dependency available: {dep_name}")
-            except ImportError as e:
+            else:
                 self.status.available[dep_name] = False
                 self.status.missing.append(dep_name)
-                self.status.errors[dep_name] = str(e)
+                self.status.errors[dep_name] = str(error)
                 
-                if dep_name in ["textblob", "tweepy", "praw", "newsapi"]:
+                if dep_name in _OPTIONAL_DEPENDENCIES:
                     # Optional dependencies
                     logger.warning(f"⚠️ Optional dependency missing: {dep_name}")
                     logger.info(f"💡 To install: pip install {package_name}")
@@ -90,12 +152,13 @@ class DependencyManager:
         
         # Log summary
         available_count = sum(self.status.available.values())
-        total_count = len(dependencies)
+        total_count = len(_DEPENDENCIES)
         logger.info(f"📊 Dependencies: {available_count}/{total_count} available")
         
         if self.status.missing:
             logger.warning(f"⚠️ Missing dependencies: {', '.join(self.status.missing)}")
         
+        self._validated = True
         return self.status
     
     def get_fallback_for_missing_dependency(self, dependency: str) -> Optional[Callable]:
@@ -120,20 +183,19 @@ class DependencyManager:
         Returns:
             True if feature is available
         """
-        feature_deps = {
-            "sentiment_analysis": ["textblob"],
-            "twitter_sentiment": ["tweepy", "textblob"],
-            "reddit_sentiment": ["praw", "textblob"],
-            "news_sentiment": ["newsapi", "textblob"],
-            "ml_prediction": ["pandas", "numpy", "sklearn", "joblib"],
-            "technical_analysis": ["ta", "pandas", "numpy"]
-        }
+        cached = self._feature_cache.get(feature)
+        if cached is not None:
+            return cached
         
-        if feature not in feature_deps:
+        required_deps = _FEATURE_DEPENDENCIES.get(feature)
+        if required_deps is None:
             return True  # Unknown features are assumed available
         
-        required_deps = feature_deps[feature]
-        return all(self.status.available.get(dep, False) for dep in required_deps)
+        available = all(self.status.available.get(dep, False) for dep in required_deps)
+        # Only memoize once validation has filled the status
+        if self._validated:
+            self._feature_cache[feature] = available
+        return available
     
     def get_installation_instructions(self, dependency: str) -> str:
         """
@@ -145,20 +207,7 @@ class DependencyManager:
         Returns:
             Installation instruction string
         """
-        instructions = {
-            "textblob": "pip install textblob && python -m textblob.download_corpora",
-            "tweepy": "pip install tweepy",
-            "praw": "pip install praw",
-            "newsapi": "pip install newsapi-python",
-            "requests": "pip install requests",
-            "pandas": "pip install pandas",
-            "numpy": "pip install numpy",
-            "ta": "pip install ta",
-            "joblib": "pip install joblib",
-            "sklearn": "pip install scikit-learn"
-        }
-        
-        return instructions.get(dependency, f"pip install {dependency}")
+        return _INSTALL_INSTRUCTIONS.get(dependency, f"pip install {dependency}")
     
     def safe_import(self, module_name: str, fallback_value: Any = None):
         """
@@ -171,6 +220,9 @@ class DependencyManager:
         Returns:
             Imported module or fallback value
         """
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
         try:
             return importlib.import_module(module_name)
         except ImportError:
@@ -8,16 +8,45 @@ from typing import Optional, Dict, Any
 
 
 class CryptoBackendException(Exception):
-    """Base exception for all backend errors with enhanced context"""
+    """
+    Base exception for all backend errors with enhanced context
+    
+    Subclasses store their details as attributes and build the context dict
+    in _build_context(), only when it is first read. The timestamp is
+    likewise taken lazily.
+    """
     
     def __init__(self, message: str, error_code: Optional[str] = None, 
                  context: Optional[Dict[str, Any]] = None, original_error: Optional[Exception] = None):
         super().__init__(message)
         self.message = message
         self.error_code = error_code
-        self.context = context or {}
+        self._context = context
         self.original_error = original_error
-        self.timestamp = time.time()
+        self._timestamp = None
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Structured error details"""
+        if self._context is None:
+            self._context = self._build_context()
+        return self._context
+    
+    def _build_context(self) -> Dict[str, Any]:
+        """Build the context dict from subclass attributes"""
+        return {}
+    
+    @property
+    def timestamp(self) -> float:
+        """
+        Time the error was first reported
+        
+        Read on first access (logging, to_dict) so errors caught and
+        suppressed in retry loops never call time.time().
+        """
+        if self._timestamp is None:
+            self._timestamp = time.time()
+        return self._timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/API responses"""
@@ -94,15 +123,20 @@ class BinanceAPIError(CryptoBackendException):
     
     def __init__(self, message: str, status_code: Optional[int] = None, 
                  symbol: Optional[str] = None, attempt: Optional[int] = None):
+        super().__init__(message, "BINANCE_API_ERROR")
+        self.status_code = status_code
+        self.symbol = symbol
+        self.attempt = attempt
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if status_code:
-            context["status_code"] = status_code
-        if symbol:
-            context["symbol"] = symbol
-        if attempt:
-            context["attempt"] = attempt
-        
-        super().__init__(message, "BINANCE_API_ERROR", context)
+        if self.status_code:
+            context["status_code"] = self.status_code
+        if self.symbol:
+            context["symbol"] = self.symbol
+        if self.attempt:
+            context["attempt"] = self.attempt
+        return context
 
 
 class TelegramAPIError(CryptoBackendException):
@@ -124,15 +158,20 @@ class InsufficientDataError(CryptoBackendException):
     
     def __init__(self, message: str, required: Optional[int] = None, 
                  received: Optional[int] = None, symbol: Optional[str] = None):
+        super().__init__(message, "INSUFFICIENT_DATA")
+        self.required = required
+        self.received = received
+        self.symbol = symbol
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if required:
-            context["required"] = required
-        if received:
-            context["received"] = received
-        if symbol:
-            context["symbol"] = symbol
-        
-        super().__init__(message, "INSUFFICIENT_DATA", context)
+        if self.required:
+            context["required"] = self.required
+        if self.received:
+            context["received"] = self.received
+        if self.symbol:
+            context["symbol"] = self.symbol
+        return context
 
 
 class DataQualityError(CryptoBackendException):
@@ -140,11 +179,15 @@ class DataQualityError(CryptoBackendException):
     
     def __init__(self, message: str, symbol: Optional[str] = None, 
                  quality_issues: Optional[Dict] = None):
-        context = {"symbol": symbol} if symbol else {}
-        if quality_issues:
-            context["quality_issues"] = quality_issues
-        
-        super().__init__(message, "DATA_QUALITY_ERROR", context)
+        super().__init__(message, "DATA_QUALITY_ERROR")
+        self.symbol = symbol
+        self.quality_issues = quality_issues
+    
+    def _build_context(self) -> Dict[str, Any]:
+        context = {"symbol": self.symbol} if self.symbol else {}
+        if self.quality_issues:
+            context["quality_issues"] = self.quality_issues
+        return context
 
 
 class InvalidSymbolError(CryptoBackendException):
@@ -166,15 +209,20 @@ class ModelNotFoundError(CryptoBackendException):
     
     def __init__(self, message: str, model_path: Optional[str] = None, 
                  symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        super().__init__(message, "MODEL_NOT_FOUND")
+        self.model_path = model_path
+        self.symbol = symbol
+        self.timeframe = timeframe
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if model_path:
-            context["model_path"] = model_path
-        if symbol:
-            context["symbol"] = symbol
-        if timeframe:
-            context["timeframe"] = timeframe
-        
-        super().__init__(message, "MODEL_NOT_FOUND", context)
+        if self.model_path:
+            context["model_path"] = self.model_path
+        if self.symbol:
+            context["symbol"] = self.symbol
+        if self.timeframe:
+            context["timeframe"] = self.timeframe
+        return context
 
 
 class ModelLoadError(CryptoBackendException):
@@ -187,13 +235,17 @@ class PredictionError(CryptoBackendException):
     
     def __init__(self, message: str, symbol: Optional[str] = None, 
                  prediction_type: Optional[str] = None, original_error: Optional[Exception] = None):
+        super().__init__(message, "PREDICTION_ERROR", original_error=original_error)
+        self.symbol = symbol
+        self.prediction_type = prediction_type
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if symbol:
-            context["symbol"] = symbol
-        if prediction_type:
-            context["prediction_type"] = prediction_type
-        
-        super().__init__(message, "PREDICTION_ERROR", context, original_error)
+        if self.symbol:
+            context["symbol"] = self.symbol
+        if self.prediction_type:
+            context["prediction_type"] = self.prediction_type
+        return context
 
 
 class FeatureError(CryptoBackendException):
@@ -234,15 +286,20 @@ class ConfigurationError(CryptoBackendException):
     
     def __init__(self, message: str, parameter: Optional[str] = None, 
                  expected_type: Optional[str] = None, received_value: Optional[Any] = None):
+        super().__init__(message, "CONFIGURATION_ERROR")
+        self.parameter = parameter
+        self.expected_type = expected_type
+        self.received_value = received_value
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if parameter:
-            context["parameter"] = parameter
-        if expected_type:
-            context["expected_type"] = expected_type
-        if received_value is not None:
-            context["received_value"] = str(received_value)
-        
-        super().__init__(message, "CONFIGURATION_ERROR", context)
+        if self.parameter:
+            context["parameter"] = self.parameter
+        if self.expected_type:
+            context["expected_type"] = self.expected_type
+        if self.received_value is not None:
+            context["received_value"] = str(self.received_value)
+        return context
 
 
 class MissingAPIKeyError(ConfigurationError):
@@ -259,15 +316,20 @@ class ValidationError(CryptoBackendException):
     
     def __init__(self, message: str, field: Optional[str] = None, 
                  value: Optional[Any] = None, constraint: Optional[str] = None):
+        super().__init__(message, "VALIDATION_ERROR")
+        self.field = field
+        self.value = value
+        self.constraint = constraint
+    
+    def _build_context(self) -> Dict[str, Any]:
         context = {}
-        if field:
-            context["field"] = field
-        if value is not None:
-            context["value"] = str(value)
-        if constraint:
-            context["constraint"] = constraint
-        
-        super().__init__(message, "VALIDATION_ERROR", context)
+        if self.field:
+            context["field"] = self.field
+        if self.value is not None:
+            context["value"] = str(self.value)
+        if self.constraint:
+            context["constraint"] = self.constraint
+        return context
 
 
 class RateLimitError(CryptoBackendException):
@@ -0,0 +1,65 @@
+"""
+Shared HTTP session with connection pooling
+Keeps TCP/TLS connections alive across outbound requests instead of
+opening a new connection for every call
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Import constants
+try:
+    from constants import (
+        HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, MAX_RETRIES, RETRY_MIN_WAIT,
+        RETRY_STATUS_CODES
+    )
+except ImportError:
+    HTTP_POOL_CONNECTIONS = 16
+    HTTP_POOL_MAXSIZE = 32
+    MAX_RETRIES = 3
+    RETRY_MIN_WAIT = 1
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_retry(total: int = MAX_RETRIES, backoff_factor: float = RETRY_MIN_WAIT) -> Retry:
+    """
+    Build the retry policy for transient failures
+
+    Retries connection errors and 429/5xx responses on GET and POST with
+    exponential backoff, honoring Retry-After. The last response is returned
+    instead of raised so callers keep checking status_code.
+    """
+    return Retry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+def create_session(pool_connections: int = HTTP_POOL_CONNECTIONS,
+                   pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                   max_retries: Retry = None) -> requests.Session:
+    """
+    Create a requests session with a pooled keep-alive adapter
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+        max_retries: Retry policy (defaults to create_retry())
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries or create_retry()
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
@@ -1,20 +1,51 @@
+import random
 import requests
 import ta
+import numpy as np
 import pandas as pd
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from cachetools import LRUCache
 from model.predict import predict_direction, predict_with_market_analysis
 from cache import cache
 from config import settings
 from logger import logger
 from typing import Optional
 from exceptions import CircuitBreaker, BinanceAPIError, InsufficientDataError, DataQualityError
+from http_session import create_session, create_retry
+
+# Fast JSON parsing for kline payloads, stdlib fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Optional C-backed indicators; the pure-pandas `ta` library is the fallback
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Optional JIT for the scalar decision kernel; plain Python when numba is absent
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 # Import constants and exceptions
 try:
     from constants import (
-        BINANCE_API_TIMEOUT, MAX_RETRIES, RETRY_MIN_WAIT, RETRY_MAX_WAIT,
+        BINANCE_API_TIMEOUT, MAX_RETRIES, RETRY_MIN_WAIT, RETRY_MAX_WAIT, UNRECOVERABLE_STATUS_CODES,
         MIN_DATA_POINTS, MIN_PRICE, MAX_PRICE, MIN_VOLUME,
-        ERROR_BINANCE_API, ERROR_INSUFFICIENT_DATA
+        ERROR_BINANCE_API, ERROR_INSUFFICIENT_DATA, SENTIMENT_TIMEOUT, SENTIMENT_WORKERS,
+        KLINES_VALIDATOR_CACHE_SIZE
     )
 except ImportError:
     # Fallback values
@@ -22,17 +53,25 @@ except ImportError:
     MAX_RETRIES = 3
     RETRY_MIN_WAIT = 1
     RETRY_MAX_WAIT = 10
+    UNRECOVERABLE_STATUS_CODES = (400, 401, 403, 404)
     MIN_DATA_POINTS = 50
     MIN_PRICE = 0.00000001
     MAX_PRICE = 1000000000
     MIN_VOLUME = 0
     ERROR_BINANCE_API = "Binance API error"
     ERROR_INSUFFICIENT_DATA = "Insufficient data for analysis"
+    SENTIMENT_TIMEOUT = 5
+    SENTIMENT_WORKERS = 4
+    KLINES_VALIDATOR_CACHE_SIZE = 256
 
 # Global circuit breaker for Binance API
 binance_circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
 binance_circuit_breaker.service_name = "Binance API"
 
+# Keep-alive session for Binance; adapter retries are off because
+# _fetch_from_api runs its own backoff loop
+_BINANCE_SESSION = create_session(max_retries=create_retry(total=0))
+
 
 class EnhancedDataFetcher:
     """
@@ -42,6 +81,14 @@ class EnhancedDataFetcher:
     def __init__(self):
         self.circuit_breaker = binance_circuit_breaker
         self.base_url = "https://api.binance.com/api/v3"
+        # Built once; each call only fills in the query parameters
+        self._klines_url = self.base_url + "/klines?symbol=%s&interval=%s&limit=%s"
+        # url -> (conditional request headers, cached candle arrays) for revalidation
+        self._validators = LRUCache(maxsize=KLINES_VALIDATOR_CACHE_SIZE)
+        self._validators_lock = threading.Lock()
+        # cache_key -> Future of the packed candles for fetches currently running
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
     
     def fetch_market_data(self, symbol: str, interval: str, limit: int = 1000) -> pd.DataFrame:
         """
@@ -61,11 +108,20 @@ class EnhancedDataFetcher:
             DataQualityError: If data quality is poor
         """
         # Check cache first
-        cache_key = f"binance_data_{symbol}_{interval}_{limit}"
+        cache_key = ("binance_data", symbol, interval, limit)
         cached_data = cache.get(cache_key)
         if cached_data is not None:
-            logger.debug(f"Cache hit for {symbol} {interval}")
-            return cached_data
+            logger.debug("Cache hit for %s %s", symbol, interval)
+            return self._frame_from_cache(cached_data)
+        
+        # Single-flight: concurrent misses on the same key wait for one API call
+        with self._inflight_lock:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                future = self._inflight[cache_key] = Future()
+        if inflight is not None:
+            logger.debug("Joining in-flight fetch for %s %s", symbol, interval)
+            return self._frame_from_cache(inflight.result())
         
         # Use circuit breaker for API calls
         try:
@@ -74,34 +130,50 @@ class EnhancedDataFetcher:
             # Validate and clean data
             df = self.validate_data_quality(df, symbol)
             
-            # Cache the result
-            cache.set(cache_key, df, ttl=settings.cache_ttl)
-            logger.info(f"Successfully fetched {len(df)} candles for {symbol} {interval}")
+            # Cache the result as compact arrays rather than the DataFrame itself
+            packed = self._frame_to_cache(df)
+            cache.set(cache_key, packed, ttl=settings.cache_ttl)
+            future.set_result(packed)
+            logger.info("Successfully fetched %d candles for %s %s", len(df), symbol, interval)
             
             return df
             
         except Exception as e:
+            future.set_exception(e)
             # Try cache fallback if available
             if cached_data is not None:
                 logger.warning(f"API failed, using stale cache for {symbol} {interval}")
-                return cached_data
+                return self._frame_from_cache(cached_data)
             raise
+        
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
     
     def _fetch_from_api(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
         """
         Internal method to fetch data from Binance API with retry logic
         """
-        url = f"{self.base_url}/klines?symbol={symbol}&interval={interval}&limit={limit}"
+        url = self._klines_url % (symbol, interval, limit)
         
         # Retry logic with exponential backoff
         last_exception = None
+        last_status = None
         for attempt in range(MAX_RETRIES):
+            retry_after = None
             try:
-                logger.debug(f"Fetching Binance data for {symbol} (attempt {attempt + 1}/{MAX_RETRIES})")
+                logger.debug("Fetching Binance data for %s (attempt %d/%d)", symbol, attempt + 1, MAX_RETRIES)
                 
-                response = requests.get(url, timeout=BINANCE_API_TIMEOUT)
+                with self._validators_lock:
+                    validator = self._validators.get(url)
+                response = _BINANCE_SESSION.get(
+                    url, headers=validator[0] if validator else None, timeout=BINANCE_API_TIMEOUT
+                )
+                if response.status_code == 304 and validator:
+                    logger.debug("Binance data not modified for %s %s", symbol, interval)
+                    return self._frame_from_cache(validator[1])
                 response.raise_for_status()
-                data = response.json()
+                data = json_loads(response.content)
                 
                 # Validate response
                 if not data or len(data) < MIN_DATA_POINTS:
@@ -112,23 +184,28 @@ class EnhancedDataFetcher:
                         symbol=symbol
                     )
                 
-                # Parse data
-                df = pd.DataFrame(data)
-                # Binance returns: [Open time, Open, High, Low, Close, Volume, ...]
-                df = df.iloc[:, :6]
-                df.columns = ["timestamp", "open", "high", "low", "close", "volume"]
-                
-                # Convert to numeric
-                numeric_columns = ["close", "high", "low", "open", "volume", "timestamp"]
-                for col in numeric_columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                
+                df = self._parse_klines(data)
+                self._remember_validator(url, response, df)
                 return df
                 
             except requests.exceptions.Timeout as e:
                 last_exception = e
                 logger.warning(f"Binance API timeout for {symbol} (attempt {attempt + 1}/{MAX_RETRIES})")
                 
+            except requests.exceptions.HTTPError as e:
+                last_exception = e
+                last_status = e.response.status_code if e.response is not None else None
+                if last_status in UNRECOVERABLE_STATUS_CODES:
+                    # Unknown symbol/interval or auth failure: retrying cannot succeed
+                    raise BinanceAPIError(
+                        f"Binance API rejected request: {e}",
+                        status_code=last_status,
+                        symbol=symbol,
+                        attempt=attempt + 1
+                    ) from e
+                retry_after = self._retry_after(e.response)
+                logger.warning(f"Binance API HTTP {last_status} for {symbol} (attempt {attempt + 1}/{MAX_RETRIES})")
+                
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 logger.warning(f"Binance API request error for {symbol}: {e} (attempt {attempt + 1}/{MAX_RETRIES})")
@@ -144,17 +221,91 @@ class EnhancedDataFetcher:
             
             # Exponential backoff before retry
             if attempt < MAX_RETRIES - 1:
-                wait_time = min(RETRY_MIN_WAIT * (2 ** attempt), RETRY_MAX_WAIT)
-                logger.debug(f"Waiting {wait_time}s before retry...")
+                if retry_after is not None:
+                    if retry_after > RETRY_MAX_WAIT:
+                        # Rate limited (429) or banned (418) for longer than we are willing to block
+                        logger.warning(f"Binance asks to wait {retry_after:.0f}s for {symbol}, giving up")
+                        break
+                    wait_time = retry_after
+                else:
+                    # Full jitter keeps callers that failed together from retrying in lockstep
+                    wait_time = random.uniform(0, min(RETRY_MIN_WAIT * (2 ** attempt), RETRY_MAX_WAIT))
+                logger.debug("Waiting %.2fs before retry...", wait_time)
                 time.sleep(wait_time)
         
         # All retries failed
         raise BinanceAPIError(
-            f"Failed to fetch data after {MAX_RETRIES} attempts: {last_exception}",
+            f"Failed to fetch data after {attempt + 1} attempts: {last_exception}",
+            status_code=last_status,
             symbol=symbol,
-            attempt=MAX_RETRIES
+            attempt=attempt + 1
         )
     
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        """Seconds from a Retry-After header (sent with 429/418), None when absent"""
+        if response is None:
+            return None
+        try:
+            return max(0.0, float(response.headers["Retry-After"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _remember_validator(self, url: str, response, df: pd.DataFrame):
+        """Keep the response's ETag/Last-Modified so the next fetch can be conditional"""
+        headers = {}
+        if response.headers.get("ETag"):
+            headers["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        # Nothing to revalidate against when the endpoint sends no validators
+        if headers:
+            with self._validators_lock:
+                self._validators[url] = (headers, self._frame_to_cache(df))
+    
+    @staticmethod
+    def _parse_klines(data: list) -> pd.DataFrame:
+        """
+        Convert raw Binance klines to an OHLCV DataFrame
+        
+        Binance returns [Open time, Open, High, Low, Close, Volume, ...] with
+        prices as strings; NumPy parses the six fields in one typed pass.
+        Malformed values fall back to per-column coercion to NaN, which
+        validate_data_quality then fills or rejects.
+        """
+        columns = ["timestamp", "open", "high", "low", "close", "volume"]
+        try:
+            df = pd.DataFrame(np.array([row[:6] for row in data], dtype=np.float64), columns=columns)
+            df["timestamp"] = df["timestamp"].astype(np.int64)
+            return df
+        except (ValueError, TypeError):
+            df = pd.DataFrame(data).iloc[:, :6]
+            df.columns = columns
+            for col in columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+            return df
+    
+    @staticmethod
+    def _frame_to_cache(df: pd.DataFrame) -> tuple:
+        """Pack an OHLCV DataFrame into (int64 timestamps, float64 (N, 5) OHLCV block)"""
+        return (
+            df["timestamp"].to_numpy(dtype=np.int64),
+            df[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+        )
+    
+    @staticmethod
+    def _frame_from_cache(cached: tuple) -> pd.DataFrame:
+        """
+        Rebuild an OHLCV DataFrame from cached arrays
+        
+        The block is copied so callers adding or editing columns never
+        touch the cached buffer.
+        """
+        ts, block = cached
+        df = pd.DataFrame(block, columns=OHLCV_COLUMNS, copy=True)
+        df.insert(0, "timestamp", ts)
+        return df
+    
     def validate_data_quality(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
         """
         Validate and clean data quality
@@ -171,27 +322,28 @@ class EnhancedDataFetcher:
         """
         quality_issues = {}
         
-        # Check for NaN values
-        if df.isnull().any().any():
+        # Check for NaN values: one pass over the float64 block, clean data exits here
+        if np.isnan(df.to_numpy(dtype=np.float64, copy=False)).any():
             null_counts = df.isnull().sum()
             quality_issues["null_values"] = null_counts[null_counts > 0].to_dict()
             logger.warning(f"Data contains NaN values for {symbol}: {quality_issues['null_values']}")
             
             # Fill NaN with forward fill, then backward fill
-            df = df.fillna(method='ffill').fillna(method='bfill')
+            df = df.ffill().bfill()
             
             # If still has NaN, raise error
-            if df.isnull().any().any():
+            if np.isnan(df.to_numpy(dtype=np.float64, copy=False)).any():
                 raise DataQualityError(
                     f"Unable to fill NaN values for {symbol}",
                     symbol=symbol,
                     quality_issues=quality_issues
                 )
         
-        # Validate price ranges
-        price_columns = ['open', 'high', 'low', 'close']
-        for col in price_columns:
-            if col in df.columns:
+        # Validate price ranges: min/max reductions first, masks only when out of range
+        price_columns = [col for col in ('open', 'high', 'low', 'close') if col in df.columns]
+        prices = df[price_columns].to_numpy(dtype=np.float64)
+        if prices.size and (prices.min() < MIN_PRICE or prices.max() > MAX_PRICE):
+            for col in price_columns:
                 invalid_prices = (df[col] < MIN_PRICE) | (df[col] > MAX_PRICE)
                 if invalid_prices.any():
                     quality_issues[f"invalid_{col}_prices"] = invalid_prices.sum()
@@ -204,23 +356,19 @@ class EnhancedDataFetcher:
             )
         
         # Validate volume
-        if 'volume' in df.columns:
-            invalid_volume = df['volume'] < MIN_VOLUME
-            if invalid_volume.any():
-                quality_issues["invalid_volume"] = invalid_volume.sum()
-                logger.warning(f"Invalid volume data for {symbol}: {quality_issues['invalid_volume']} records")
+        if 'volume' in df.columns and len(df) and df['volume'].to_numpy().min() < MIN_VOLUME:
+            quality_issues["invalid_volume"] = (df['volume'] < MIN_VOLUME).sum()
+            logger.warning(f"Invalid volume data for {symbol}: {quality_issues['invalid_volume']} records")
         
-        # Validate OHLC logic
-        ohlc_issues = (
-            (df['high'] < df['low']) |
-            (df['high'] < df['open']) |
-            (df['high'] < df['close']) |
-            (df['low'] > df['open']) |
-            (df['low'] > df['close'])
-        )
+        # Validate OHLC logic on the price block: high must top, and low undercut, the others
+        if len(price_columns) == 4:
+            o, h, l, c = prices.T
+            ohlc_issues = (h < np.maximum(np.maximum(o, l), c)) | (l > np.minimum(o, c))
+        else:
+            ohlc_issues = np.zeros(0, dtype=bool)
         
         if ohlc_issues.any():
-            quality_issues["ohlc_logic_errors"] = ohlc_issues.sum()
+            quality_issues["ohlc_logic_errors"] = int(ohlc_issues.sum())
             logger.warning(f"OHLC logic errors for {symbol}: {quality_issues['ohlc_logic_errors']} records")
         
         # Log quality summary
@@ -253,7 +401,151 @@ def get_binance_data(symbol="BTCUSDT", interval="1h", limit=1000):
     """
     return enhanced_data_fetcher.fetch_market_data(symbol, interval, limit)
 
-def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_balance=None):
+@njit(cache=True)
+def _fused_emas(close):
+    """
+    EMA20, EMA50 and MACD histogram (12/26/9) in one pass over close
+    
+    Same recurrence and warm-up NaNs as the `ta` functions it replaces;
+    only used when numba can compile it, a Python loop is slower than `ta`.
+    """
+    n = close.size
+    ema20 = np.empty(n)
+    ema50 = np.empty(n)
+    macd_diff = np.empty(n)
+    a20, a50, a12, a26, a9 = 2.0 / 21, 2.0 / 51, 2.0 / 13, 2.0 / 27, 2.0 / 10
+    e20 = e50 = e12 = e26 = close[0]
+    sig = 0.0
+    for i in range(n):
+        x = close[i]
+        e20 = a20 * x + (1 - a20) * e20
+        e50 = a50 * x + (1 - a50) * e50
+        e12 = a12 * x + (1 - a12) * e12
+        e26 = a26 * x + (1 - a26) * e26
+        ema20[i] = e20 if i >= 19 else np.nan
+        ema50[i] = e50 if i >= 49 else np.nan
+        macd = e12 - e26
+        # Signal line starts once the MACD has its 26-candle warm-up
+        if i >= 25:
+            sig = macd if i == 25 else a9 * macd + (1 - a9) * sig
+        macd_diff[i] = macd - sig if i >= 33 else np.nan
+    return ema20, ema50, macd_diff
+
+def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the OHLCV DataFrame with the signal indicator columns appended
+    
+    Uses TA-Lib on float64 arrays when installed, the `ta` library otherwise.
+    Stochastic is the fast %K(14) with a 3-period SMA %D in both cases.
+    Columns are collected first and joined with one concat, which is
+    cheaper than inserting them into the frame one at a time.
+    """
+    if TALIB_AVAILABLE:
+        close = df["close"].to_numpy(dtype=np.float64)
+        high = df["high"].to_numpy(dtype=np.float64)
+        low = df["low"].to_numpy(dtype=np.float64)
+        
+        ind = {
+            "rsi": talib.RSI(close, timeperiod=14),
+            "ema20": talib.EMA(close, timeperiod=20),
+            "ema50": talib.EMA(close, timeperiod=50),
+            "macd": talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)[2],
+            "atr": talib.ATR(high, low, close, timeperiod=14),
+        }
+        ind["stoch_k"], ind["stoch_d"] = talib.STOCHF(high, low, close, fastk_period=14, fastd_period=3, fastd_matype=0)
+        ind["adx"] = talib.ADX(high, low, close, timeperiod=14)
+    else:
+        ind = {"rsi": ta.momentum.rsi(df["close"], window=14)}
+        if NUMBA_AVAILABLE:
+            ind["ema20"], ind["ema50"], ind["macd"] = _fused_emas(df["close"].to_numpy(dtype=np.float64))
+        else:
+            ind["ema20"] = ta.trend.ema_indicator(df["close"], window=20)
+            ind["ema50"] = ta.trend.ema_indicator(df["close"], window=50)
+            ind["macd"] = ta.trend.macd_diff(df["close"])
+        
+        # Additional indicators
+        ind["atr"] = ta.volatility.average_true_range(df["high"], df["low"], df["close"], window=14)
+        stoch = ta.momentum.StochasticOscillator(df["high"], df["low"], df["close"])
+        ind["stoch_k"] = stoch.stoch()
+        ind["stoch_d"] = stoch.stoch_signal()
+        ind["adx"] = ta.trend.adx(df["high"], df["low"], df["close"], window=14)
+    
+    # Recomputing replaces earlier indicator columns instead of duplicating them
+    base = df.drop(columns=list(ind), errors="ignore")
+    return pd.concat([base, pd.DataFrame(ind, index=df.index)], axis=1)
+
+INDICATOR_COLUMNS = ("rsi", "ema20", "ema50", "macd", "atr", "stoch_k", "stoch_d", "adx")
+
+def add_indicators_cached(df: pd.DataFrame, symbol: str, interval: str) -> pd.DataFrame:
+    """
+    add_indicators memoized per candle snapshot
+    
+    Keyed by the frame length, last timestamp and last candle's OHLCV, so an
+    update to the still-open candle recomputes while repeat requests on the
+    same data reuse the cached (N, 8) indicator block. Such keys go stale with
+    the next tick, so entries live at most cache_ttl, not a whole interval.
+    """
+    key = (
+        "indicators", symbol, interval, len(df), int(df["timestamp"].iat[-1]),
+        *(float(df[col].iat[-1]) for col in OHLCV_COLUMNS)
+    )
+    block = cache.get(key)
+    if block is None:
+        df = add_indicators(df)
+        cache.set(key, df[list(INDICATOR_COLUMNS)].to_numpy(dtype=np.float64), ttl=_snapshot_ttl(interval))
+        return df
+    
+    base = df.drop(columns=list(INDICATOR_COLUMNS), errors="ignore")
+    return pd.concat([base, pd.DataFrame(block, columns=INDICATOR_COLUMNS, index=df.index, copy=True)], axis=1)
+
+LAST_VALUE_COLUMNS = ("close",) + INDICATOR_COLUMNS
+
+def latest_values(df: pd.DataFrame) -> dict:
+    """Last candle's close and indicators as plain Python floats, each read once with iat"""
+    values = np.array([df[col].iat[-1] for col in LAST_VALUE_COLUMNS], dtype=np.float64)
+    return dict(zip(LAST_VALUE_COLUMNS, values.tolist()))
+
+def latest_indicators(df: pd.DataFrame, values: Optional[dict] = None) -> dict:
+    """Last candle's indicators rounded to 2 decimals, in one vectorized pass"""
+    if values is None:
+        values = latest_values(df)
+    rounded = np.round(np.array([values[col] for col in INDICATOR_COLUMNS], dtype=np.float64), 2)
+    return dict(zip(INDICATOR_COLUMNS, rounded.tolist()))
+
+def build_chart_data(df: pd.DataFrame, include_volume: bool = False, columnar: bool = False):
+    """
+    Convert OHLC(V) candles to the chart payload
+    
+    Columns are pulled out once as NumPy arrays and zipped, instead of
+    boxing every row into a Series with iterrows(). With columnar=True the
+    arrays are returned as-is ({"time": [...], "open": [...], ...}), which
+    skips the per-candle dicts and shrinks the JSON body.
+    """
+    times = (df["timestamp"].to_numpy(dtype=np.int64) // 1000).tolist()
+    opens = df["open"].to_numpy(dtype=np.float64).tolist()
+    highs = df["high"].to_numpy(dtype=np.float64).tolist()
+    lows = df["low"].to_numpy(dtype=np.float64).tolist()
+    closes = df["close"].to_numpy(dtype=np.float64).tolist()
+    
+    if include_volume:
+        volumes = (
+            df["volume"].to_numpy(dtype=np.float64).tolist() if "volume" in df.columns
+            else [0.0] * len(df)
+        )
+        if columnar:
+            return {"time": times, "open": opens, "high": highs, "low": lows, "close": closes, "volume": volumes}
+        return [
+            {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(times, opens, highs, lows, closes, volumes)
+        ]
+    if columnar:
+        return {"time": times, "open": opens, "high": highs, "low": lows, "close": closes}
+    return [
+        {"time": t, "open": o, "high": h, "low": l, "close": c}
+        for t, o, h, l, c in zip(times, opens, highs, lows, closes)
+    ]
+
+def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_balance=None, columnar_chart=False):
     """
     Generate trading signal with optional advanced prediction
     
@@ -262,6 +554,7 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
         timeframe: Timeframe for analysis
         use_advanced_prediction: Use market predictor with leverage/risk analysis
         account_balance: Account balance for position sizing
+        columnar_chart: Return chart_data as per-field arrays instead of per-candle dicts
     """
     clean_symbol = symbol.replace("/", "").upper()
     
@@ -276,44 +569,131 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
     
     if df.empty:
         return {"error": "Could not fetch data"}
+    
+    # Keyed like add_indicators_cached: while the last candle's OHLCV is
+    # unchanged, indicators and prediction are identical; a tick on the
+    # still-open candle produces a new key, so entries only live cache_ttl
+    response_key = (
+        "ind", clean_symbol, timeframe, int(df["timestamp"].iat[-1]),
+        *(float(df[col].iat[-1]) for col in OHLCV_COLUMNS),
+        use_advanced_prediction, account_balance, columnar_chart
+    )
+    cached = cache.get(response_key)
+    if cached is not None:
+        logger.debug("Signal cache hit for %s %s", clean_symbol, timeframe)
+        return dict(cached)
+    
+    response = _build_signal(
+        df, symbol, clean_symbol, timeframe, use_advanced_prediction, account_balance, columnar_chart
+    )
+    cache.set(response_key, response, ttl=_snapshot_ttl(timeframe))
+    return dict(response)
+
+def _interval_to_seconds(interval: str) -> int:
+    """Length of a Binance kline interval ("15m", "1h", "1w"...) in seconds"""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "M": 2592000}
+    try:
+        return int(interval[:-1]) * units[interval[-1]]
+    except (KeyError, ValueError):
+        return settings.cache_ttl
+
+def _snapshot_ttl(interval: str) -> int:
+    """TTL for entries keyed on the still-open candle: stale after the next tick"""
+    return min(settings.cache_ttl, _interval_to_seconds(interval))
 
-    # Calculate indicators
-    df["rsi"] = ta.momentum.rsi(df["close"], window=14)
-    df["ema20"] = ta.trend.ema_indicator(df["close"], window=20)
-    df["ema50"] = ta.trend.ema_indicator(df["close"], window=50)
-    df["macd"] = ta.trend.macd_diff(df["close"])
+# Shared sentiment analyzer, created on first use; reusing it also keeps its
+# per-source sentiment cache alive between requests
+_sentiment_analyzer = None
+_sentiment_analyzer_lock = threading.Lock()
+
+def _get_sentiment_analyzer():
+    """Return the shared sentiment analyzer, creating it on first call"""
+    global _sentiment_analyzer
+    if _sentiment_analyzer is None:
+        with _sentiment_analyzer_lock:
+            if _sentiment_analyzer is None:
+                from ml.sentiment_analyzer import create_sentiment_analyzer
+                _sentiment_analyzer = create_sentiment_analyzer({
+                    'twitter_bearer_token': settings.twitter_bearer_token,
+                    'reddit_client_id': settings.reddit_client_id,
+                    'reddit_client_secret': settings.reddit_client_secret,
+                    'news_api_key': settings.news_api_key,
+                    'cache_ttl': settings.sentiment_cache_ttl
+                })
+    return _sentiment_analyzer
+
+# Sentiment calls are network-bound; run them while indicators are computed
+_IO_POOL = ThreadPoolExecutor(max_workers=SENTIMENT_WORKERS, thread_name_prefix="sentiment")
+
+def _fetch_sentiment(clean_symbol: str) -> Optional[float]:
+    """
+    Aggregated sentiment score for a symbol, None when analysis fails
     
-    # Additional indicators
-    df["atr"] = ta.volatility.average_true_range(df["high"], df["low"], df["close"], window=14)
-    stoch = ta.momentum.StochasticOscillator(df["high"], df["low"], df["close"])
-    df["stoch_k"] = stoch.stoch()
-    df["stoch_d"] = stoch.stoch_signal()
-    df["adx"] = ta.trend.adx(df["high"], df["low"], df["close"], window=14)
-
-    last = df.iloc[-1]
+    Scores are cached as 1-tuples under ("sentiment", symbol) for
+    sentiment_cache_ttl so a cached None (failure) is distinguishable from
+    a miss; failures only stick for cache_ttl before the APIs are retried.
+    """
+    key = ("sentiment", clean_symbol)
+    try:
+        from ml.sentiment_features import get_crypto_name
+        
+        analyzer = _get_sentiment_analyzer()
+        crypto_name = get_crypto_name(clean_symbol)
+        sentiment_data = analyzer.get_aggregated_sentiment(clean_symbol, crypto_name)
+        score = sentiment_data['aggregated_sentiment']
+    except Exception as e:
+        logger.warning(f"Sentiment analysis failed: {e}")
+        cache.set(key, (None,), ttl=settings.cache_ttl)
+        return None
     
-    # Get sentiment if enabled
+    cache.set(key, (score,), ttl=settings.sentiment_cache_ttl)
+    return score
+
+# Signal labels indexed by the code returned from _decide_signal
+SIGNAL_LABELS = ("BUY", "SELL", "BUY (Trend)", "SELL (Trend)", "BUY (Weak)", "SELL (Weak)")
+
+@njit(cache=True)
+def _decide_signal(prob, rsi, close, ema20, rsi_oversold, rsi_overbought, conf, inv_conf):
+    """Basic signal logic on plain floats, returns an index into SIGNAL_LABELS"""
+    if prob > 0.60 and rsi < rsi_oversold:
+        return 0
+    if prob < 0.40 and rsi > rsi_overbought:
+        return 1
+    if prob > conf and close > ema20:
+        return 2
+    if prob < inv_conf and close < ema20:
+        return 3
+    # Instead of NEUTRE, choose based on probability and trend
+    if prob > 0.5:
+        return 0 if close > ema20 else 4
+    return 1 if close < ema20 else 5
+
+def _build_signal(df, symbol, clean_symbol, timeframe, use_advanced_prediction, account_balance, columnar_chart=False):
+    """Compute indicators, sentiment and prediction for a fetched candle frame"""
+    # Reuse a cached score, otherwise start the fetch first so the network
+    # round-trip overlaps indicator math
+    sentiment_future = None
     sentiment_score = None
     if settings.sentiment_enabled:
+        cached_sentiment = cache.get(("sentiment", clean_symbol))
+        if cached_sentiment is not None:
+            sentiment_score = cached_sentiment[0]
+        else:
+            sentiment_future = _IO_POOL.submit(_fetch_sentiment, clean_symbol)
+    
+    # Calculate indicators (shared with signal_service for the same candles)
+    df = add_indicators_cached(df, clean_symbol, timeframe)
+
+    # Last-candle scalars read once; avoids materializing the last row as a Series
+    last = latest_values(df)
+    indicators = latest_indicators(df, last)
+    
+    # Get sentiment if enabled
+    if sentiment_future is not None:
         try:
-            from ml.sentiment_analyzer import create_sentiment_analyzer
-            from ml.sentiment_features import get_crypto_name
-            
-            sentiment_config = {
-                'twitter_bearer_token': settings.twitter_bearer_token,
-                'reddit_client_id': settings.reddit_client_id,
-                'reddit_client_secret': settings.reddit_client_secret,
-                'news_api_key': settings.news_api_key,
-                'cache_ttl': settings.sentiment_cache_ttl
-            }
-            
-            analyzer = create_sentiment_analyzer(sentiment_config)
-            crypto_name = get_crypto_name(clean_symbol)
-            sentiment_data = analyzer.get_aggregated_sentiment(clean_symbol, crypto_name)
-            sentiment_score = sentiment_data['aggregated_sentiment']
+            sentiment_score = sentiment_future.result(timeout=SENTIMENT_TIMEOUT)
         except Exception as e:
-            logger.warning(f"Sentiment analysis failed: {e}")
-            sentiment_score = None
+            logger.warning(f"Sentiment analysis failed: {e!r}")
 
     # Use advanced prediction if enabled
     if use_advanced_prediction:
@@ -327,15 +707,7 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
             confidence = prediction['probability']
             
             # Format data for charts
-            chart_data = []
-            for index, row in df.iterrows():
-                chart_data.append({
-                    "time": int(row["timestamp"] / 1000),
-                    "open": row["open"],
-                    "high": row["high"],
-                    "low": row["low"],
-                    "close": row["close"]
-                })
+            chart_data = build_chart_data(df, columnar=columnar_chart)
             
             return {
                 "symbol": symbol,
@@ -343,16 +715,7 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
                 "signal": signal,
                 "confidence": round(float(confidence), 4),
                 "price": last["close"],
-                "indicators": {
-                    "rsi": round(float(last["rsi"]), 2),
-                    "ema20": round(float(last["ema20"]), 2),
-                    "ema50": round(float(last["ema50"]), 2),
-                    "macd": round(float(last["macd"]), 2),
-                    "atr": round(float(last["atr"]), 2),
-                    "stoch_k": round(float(last["stoch_k"]), 2),
-                    "stoch_d": round(float(last["stoch_d"]), 2),
-                    "adx": round(float(last["adx"]), 2)
-                },
+                "indicators": indicators,
                 "chart_data": chart_data,
                 # Advanced prediction fields
                 "leverage": prediction.get('leverage'),
@@ -371,37 +734,14 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
     prob = predict_direction(df, symbol=clean_symbol, interval=timeframe)
 
     # Enhanced Signal Logic - NO NEUTRAL, always choose BUY or SELL
-    if prob > 0.60 and last["rsi"] < settings.rsi_oversold: 
-        signal = "BUY"
-    elif prob < 0.40 and last["rsi"] > settings.rsi_overbought:
-        signal = "SELL"
-    elif prob > settings.confidence_threshold and last["close"] > last["ema20"]:
-        signal = "BUY (Trend)"
-    elif prob < (1 - settings.confidence_threshold) and last["close"] < last["ema20"]:
-        signal = "SELL (Trend)"
-    else:
-        # Instead of NEUTRE, choose based on probability and trend
-        if prob > 0.5:
-            if last["close"] > last["ema20"]:
-                signal = "BUY"
-            else:
-                signal = "BUY (Weak)"
-        else:
-            if last["close"] < last["ema20"]:
-                signal = "SELL"
-            else:
-                signal = "SELL (Weak)"
+    signal = SIGNAL_LABELS[_decide_signal(
+        float(prob), last["rsi"], last["close"], last["ema20"],
+        settings.rsi_oversold, settings.rsi_overbought,
+        settings.confidence_threshold, 1 - settings.confidence_threshold
+    )]
 
     # Format data for charts
-    chart_data = []
-    for index, row in df.iterrows():
-        chart_data.append({
-            "time": int(row["timestamp"] / 1000),
-            "open": row["open"],
-            "high": row["high"],
-            "low": row["low"],
-            "close": row["close"]
-        })
+    chart_data = build_chart_data(df, columnar=columnar_chart)
 
     return {
         "symbol": symbol,
@@ -409,16 +749,7 @@ def generate_signal(symbol, timeframe, use_advanced_prediction=True, account_bal
         "signal": signal,
         "confidence": round(float(prob), 2),
         "price": last["close"],
-        "indicators": {
-            "rsi": round(float(last["rsi"]), 2),
-            "ema20": round(float(last["ema20"]), 2),
-            "ema50": round(float(last["ema50"]), 2),
-            "macd": round(float(last["macd"]), 2),
-            "atr": round(float(last["atr"]), 2),
-            "stoch_k": round(float(last["stoch_k"]), 2),
-            "stoch_d": round(float(last["stoch_d"]), 2),
-            "adx": round(float(last["adx"]), 2)
-        },
+        "indicators": indicators,
         "chart_data": chart_data,
         "sentiment": sentiment_score
     }
@@ -1,14 +1,31 @@
 """
 Enhanced logging module with structured logging and rotation
 """
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# orjson encodes datetimes and numpy scalars in C; stdlib json is the fallback
+try:
+    import orjson
+    
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+    
+    def _dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+except ImportError:
+    def _dumps(data: Dict[str, Any]) -> str:
+        if isinstance(data.get('timestamp'), datetime):
+            data['timestamp'] = data['timestamp'].isoformat().replace('+00:00', 'Z')
+        return json.dumps(data, default=str)
 
 
 class JSONFormatter(logging.Formatter):
@@ -17,7 +34,8 @@ class JSONFormatter(logging.Formatter):
     """
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            # The record's own creation time, serialized as ISO 8601 with a Z suffix
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -43,7 +61,7 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'error_context'):
             log_data['error_context'] = record.error_context
         
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -90,6 +108,26 @@ class PerformanceLogger:
             self.logger.error(f"Failed {self.operation} in {duration:.2f}ms: {exc_val}")
 
 
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for a same-process listener
+    
+    The stock prepare() flattens exc_info into the message so records can be
+    pickled; the listener here shares the process, so exc_info is kept and
+    JSONFormatter can still emit exception and stack_trace.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# Logger name -> (file handler config, listener draining that logger's queue)
+_listeners: Dict[str, Tuple[tuple, QueueListener]] = {}
+
+
 def setup_logger(
     name: str = "crypto_ai",
     level: str = "INFO",
@@ -101,6 +139,9 @@ def setup_logger(
     """
     Setup logger with file rotation and console output
     
+    The calling thread only enqueues records; a QueueListener thread does
+    the formatting, file writes and rotation.
+    
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -116,8 +157,16 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
+    # Already wired to the same file (e.g. module re-import): keep the handlers
+    config = (str(Path(log_file).resolve()), max_bytes, backup_count, json_format)
+    previous = _listeners.get(name)
+    if previous is not None and previous[0] == config and logger.handlers:
+        return logger
+    
+    # Remove existing handlers and stop their listener
     logger.handlers.clear()
+    if previous is not None:
+        _listeners.pop(name)[1].stop()
     
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
@@ -138,19 +187,30 @@ def setup_logger(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
         ))
     
-    logger.addHandler(file_handler)
-    
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(ColoredFormatter(
         '%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
         datefmt='%H:%M:%S'
     ))
-    logger.addHandler(console_handler)
+    
+    # Request threads enqueue in O(1); disk and console I/O happen on the listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_InProcessQueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = (config, listener)
     
     return logger
 
 
+@atexit.register
+def stop_listeners():
+    """Flush queued records and stop every listener thread"""
+    while _listeners:
+        _listeners.popitem()[1][1].stop()
+
+
 # Create default logger
 logger = setup_logger()
 
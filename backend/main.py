@@ -3,17 +3,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, validator
 from typing import List, Optional
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from prometheus_fastapi_instrumentator import Instrumentator
 import asyncio
+import sys
 import time
 from datetime import datetime
 
 from services.signal_service import generate_signal_service as generate_signal
-from database import get_db, save_signal, get_signal_history, Signal
+from database import get_read_db, get_signal_history, Signal
+from services.signal_writer import signal_writer
 from config import settings
 from logger_enhanced import logger, log_exception, log_api_call, performance_log
 from dependency_manager import dependency_manager
@@ -91,13 +94,33 @@ signal_generation_metrics = {
     "last_reset": datetime.utcnow()
 }
 
+# orjson-backed responses (C encoder); falls back to the stdlib encoder when unavailable
+try:
+    import orjson
+
+    def _orjson_default(obj):
+        """Fallback for values orjson cannot encode natively (numpy scalars, pandas timestamps)"""
+        if hasattr(obj, "item"):
+            return obj.item()
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson"""
+        def render(self, content) -> bytes:
+            return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    FastJSONResponse = JSONResponse
+
 # Initialize FastAPI with metadata
 app = FastAPI(
     title="Crypto AI Backend",
     description="API pour signaux de trading crypto avec Machine Learning",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse
 )
 
 # Prometheus monitoring
@@ -184,6 +207,9 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to start trading service: {e}")
     
+    # Start batched signal writer
+    signal_writer.start()
+    
     # Start Telegram alert service
     try:
         from services.telegram_alerts import telegram_alert_service
@@ -209,6 +235,9 @@ async def shutdown_event():
         logger.info("Telegram alert service stopped")
     except Exception as e:
         logger.error(f"Error stopping Telegram alert service: {e}")
+    
+    # Flush signals still waiting in the write buffer
+    signal_writer.stop()
 
 # Enhanced exception handlers with structured logging
 @app.exception_handler(BinanceAPIError)
@@ -292,35 +321,39 @@ async def global_exception_handler(request: Request, exc: Exception):
 class RequestData(BaseModel):
     symbol: str
     timeframe: str = "1h"
+    # chart_data as {"time": [...], "open": [...], ...} instead of one dict per candle
+    columnar_chart: bool = False
     
     @validator('symbol')
     def validate_symbol(cls, v):
         if v not in settings.default_cryptos:
             raise ValueError(f"Symbol must be one of {settings.default_cryptos}")
-        return v
+        # Interned: symbols come from a tiny alphabet and key caches/dicts downstream
+        return sys.intern(v)
     
     @validator('timeframe')
     def validate_timeframe(cls, v):
         if v not in settings.available_timeframes:
             raise ValueError(f"Timeframe must be one of {settings.available_timeframes}")
-        return v
+        return sys.intern(v)
 
 class MultiRequestData(BaseModel):
     symbols: List[str]
     timeframe: str = "1h"
+    columnar_chart: bool = False
     
     @validator('symbols')
     def validate_symbols(cls, v):
         for symbol in v:
             if symbol not in settings.default_cryptos:
                 raise ValueError(f"All symbols must be in {settings.default_cryptos}")
-        return v
+        return [sys.intern(symbol) for symbol in v]
     
     @validator('timeframe')
     def validate_timeframe(cls, v):
         if v not in settings.available_timeframes:
             raise ValueError(f"Timeframe must be one of {settings.available_timeframes}")
-        return v
+        return sys.intern(v)
 
 @app.get("/", tags=["Health"])
 def read_root():
@@ -337,7 +370,7 @@ def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat() + "Z"}
 
 @app.get("/health/detailed", tags=["Health"])
-async def detailed_health_check():
+async def detailed_health_check(db: Session = Depends(get_read_db)):
     """
     Enhanced health check - verifies all critical components with dependency status
     
@@ -356,10 +389,7 @@ async def detailed_health_check():
     
     # Check Database
     try:
-        from database import SessionLocal
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
+        db.execute(text("SELECT 1"))
         health_status["components"]["database"] = {
             "status": "healthy",
             "message": "Database connection OK"
@@ -650,7 +680,7 @@ async def run_backtest(request: Request, symbol: str = "BTCUSDT", days: int = DE
         if days > MAX_BACKTEST_DAYS:
             raise HTTPException(status_code=400, detail=f"Maximum {MAX_BACKTEST_DAYS} days allowed")
         
-        results = simulate_trading(symbol, days)
+        results = await asyncio.to_thread(simulate_trading, symbol, days)
         return results
     except Exception as e:
         logger.error(f"Backtest error: {e}")
@@ -681,7 +711,10 @@ async def get_signal(request: Request, data: RequestData):
     
     try:
         with performance_log("signal_generation", symbol=data.symbol, timeframe=data.timeframe):
-            signal_data = generate_signal(data.symbol, data.timeframe)
+            # Blocking I/O + inference runs in a worker thread to keep the event loop free
+            signal_data = await asyncio.to_thread(
+                generate_signal, data.symbol, data.timeframe, columnar_chart=data.columnar_chart
+            )
             
             # Log API call
             duration_ms = (time.time() - start_time) * 1000
@@ -705,7 +738,7 @@ async def get_signal(request: Request, data: RequestData):
                 )
             
             if "error" not in signal_data:
-                save_signal(signal_data)
+                signal_writer.enqueue(signal_data)
             
             return signal_data
             
@@ -733,14 +766,17 @@ async def get_multi_signals(request: Request, data: MultiRequestData):
     try:
         with performance_log("multi_signal_generation", symbols=data.symbols, timeframe=data.timeframe):
             results = []
+            to_save = []
             successful_signals = 0
             failed_signals = 0
             
             for symbol in data.symbols:
                 try:
-                    signal_data = generate_signal(symbol, data.timeframe)
+                    signal_data = await asyncio.to_thread(
+                        generate_signal, symbol, data.timeframe, columnar_chart=data.columnar_chart
+                    )
                     if "error" not in signal_data:
-                        save_signal(signal_data)
+                        to_save.append(signal_data)
                         successful_signals += 1
                     else:
                         failed_signals += 1
@@ -750,6 +786,9 @@ async def get_multi_signals(request: Request, data: MultiRequestData):
                     logger.error(f"Failed to generate signal for {symbol}: {e}")
                     results.append({"symbol": symbol, "error": str(e)})
             
+            # Persist the whole sweep through the batched writer
+            signal_writer.enqueue_many(to_save)
+            
             duration_ms = (time.time() - start_time) * 1000
             log_api_call(
                 "POST", "/signals/multi", 200, duration_ms,
@@ -779,7 +818,9 @@ async def get_history(
     request: Request, 
     symbol: Optional[str] = None, 
     limit: int = DEFAULT_QUERY_LIMIT,
-    offset: int = 0
+    offset: int = 0,
+    before_ts: Optional[datetime] = None,
+    before_id: Optional[int] = None
 ):
     """
     Get signal history from database with pagination
@@ -788,12 +829,15 @@ async def get_history(
         symbol: Optional crypto symbol to filter
         limit: Maximum number of results (default: 100, max: 1000)
         offset: Number of records to skip for pagination (default: 0)
+        before_ts: Cursor timestamp from the previous page's next_cursor (replaces offset)
+        before_id: Cursor id from the previous page's next_cursor
         
     Returns:
         dict: Historical signals with metadata and pagination info
         
     Example:
         GET /signals/history?symbol=BTCUSDT&limit=50&offset=0
+        GET /signals/history?symbol=BTCUSDT&limit=50&before_ts=2024-01-01T12:00:00&before_id=4012
     """
     try:
         if limit > MAX_QUERY_LIMIT:
@@ -802,13 +846,20 @@ async def get_history(
         if offset < 0:
             raise HTTPException(status_code=400, detail="Offset cannot be negative")
             
-        signals = get_signal_history(symbol, limit, offset)
+        signals = await asyncio.to_thread(
+            get_signal_history, symbol, limit, offset, before_ts, before_id
+        )
+        has_more = len(signals) == limit  # Hint if there are more results
         
         return {
             "count": len(signals),
             "limit": limit,
             "offset": offset,
-            "has_more": len(signals) == limit,  # Hint if there are more results
+            "has_more": has_more,
+            "next_cursor": {
+                "before_ts": signals[-1].timestamp.isoformat(),
+                "before_id": signals[-1].id
+            } if has_more and signals else None,
             "signals": [
                 {
                     "id": s.id,
@@ -851,7 +902,7 @@ async def websocket_signals(websocket: WebSocket):
             signals = []
             for symbol in settings.default_cryptos:
                 try:
-                    signal_data = generate_signal(symbol, "1h")
+                    signal_data = await asyncio.to_thread(generate_signal, symbol, "1h")
                     if "error" not in signal_data:
                         signals.append(signal_data)
                 except Exception as e:
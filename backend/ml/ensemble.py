@@ -17,6 +17,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import cross_val_score, TimeSeriesSplit
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report
 import joblib
+import json
 from pathlib import Path
 from datetime import datetime
 
@@ -461,6 +462,9 @@ class EnsembleTrainer:
         joblib.dump(ensemble_data, latest_path)
         print(f"💾 Latest ensemble: {latest_path}")
         
+        # Summary sidecar so reports don't need to unpickle the models
+        save_ensemble_metadata(ensemble_data, latest_path)
+        
         # Also save best model separately
         best_model_data = {
             'model': best_model,
@@ -477,6 +481,30 @@ class EnsembleTrainer:
         print(f"💾 Best model ({best_name}): {best_path}")
 
 
+def save_ensemble_metadata(ensemble_data: Dict, ensemble_path: Path) -> Dict:
+    """
+    Write the summary metadata of an ensemble next to its pickle
+    
+    Args:
+        ensemble_data: Ensemble data dict (as saved by save_ensemble)
+        ensemble_path: Path of the ensemble pickle
+        
+    Returns:
+        Metadata dict that was written
+    """
+    stacking = ensemble_data['performance'].get('stacking')
+    metadata = {
+        'best_model_name': ensemble_data['best_model_name'],
+        'best_accuracy': float(ensemble_data['best_accuracy']),
+        'stacking_acc': float(stacking['test_accuracy']) if stacking else None
+    }
+    
+    with open(Path(ensemble_path).with_suffix('.meta.json'), 'w') as f:
+        json.dump(metadata, f)
+    
+    return metadata
+
+
 def load_ensemble(
     symbol: str,
     interval: str,
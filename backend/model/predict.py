@@ -31,7 +31,7 @@ def load_model(symbol="BTCUSDT", interval="1h", use_ensemble=True):
     
     # Check cache first
     if cache_key in _model_cache:
-        logger.debug(f"Model cache hit: {cache_key}")
+        logger.debug("Model cache hit: %s", cache_key)
         return _model_cache[cache_key]
     
     # Model directory is at backend/ml/models (parent of model directory)
@@ -101,6 +101,7 @@ def predict_direction(df: pd.DataFrame, symbol="BTCUSDT", interval="1h",
                     logger.warning("ML prediction dependencies not available, using heuristic")
                     return _enhanced_fallback_heuristic(df, symbol)
                 
+                # create_features works on its own copy, df is left untouched
                 from ml.features import create_features
                 
                 # Check if this is an ensemble
@@ -111,7 +112,7 @@ def predict_direction(df: pd.DataFrame, symbol="BTCUSDT", interval="1h",
                     from ml.ensemble import predict_with_ensemble
                     
                     # Prepare features
-                    df_features = create_features(df.copy())
+                    df_features = create_features(df)
                     
                     # Drop 'target' column if it exists in the DataFrame
                     if 'target' in df_features.columns:
@@ -136,7 +137,7 @@ def predict_direction(df: pd.DataFrame, symbol="BTCUSDT", interval="1h",
                     
                 else:
                     # Single model prediction
-                    df_features = create_features(df.copy())
+                    df_features = create_features(df)
                     
                     # Drop 'target' column if it exists in the DataFrame
                     if 'target' in df_features.columns:
@@ -1,11 +1,10 @@
-import ta
 import pandas as pd
 import numpy as np
 from model.predict import predict_with_market_analysis
 from cache import cache
 from config import settings
 from logger import logger
-from indicators.signals import get_binance_data
+from indicators.signals import get_binance_data, add_indicators_cached, build_chart_data
 from dependency_manager import dependency_manager
 from exceptions import PredictionError
 
@@ -18,13 +17,14 @@ class UnifiedSignalGenerator:
     def __init__(self):
         self.dependency_status = dependency_manager.validate_dependencies()
     
-    def generate_signal(self, symbol: str, timeframe: str) -> dict:
+    def generate_signal(self, symbol: str, timeframe: str, columnar_chart: bool = False) -> dict:
         """
         Generate signal with unified logic, dependency management and enhanced reliability
         
         Args:
             symbol: Trading symbol
             timeframe: Timeframe for analysis
+            columnar_chart: Return chart_data as per-field arrays instead of per-candle dicts
             
         Returns:
             Enhanced signal data dictionary with reliability metrics
@@ -39,7 +39,7 @@ class UnifiedSignalGenerator:
                 return {"error": "Could not fetch data"}
 
             # 2. Calculate Technical Indicators
-            df = self._calculate_indicators(df)
+            df = self._calculate_indicators(df, clean_symbol, timeframe)
             
             # 3. Validate Data Quality
             data_quality_score = self._validate_data_quality(df)
@@ -80,27 +80,19 @@ class UnifiedSignalGenerator:
             )
             
             # 8. Format Response with Enhanced Metrics
-            return self._format_response(clean_symbol, timeframe, final_signal, final_confidence, df, sentiment_score)
+            return self._format_response(
+                clean_symbol, timeframe, final_signal, final_confidence, df, sentiment_score, columnar_chart
+            )
             
         except Exception as e:
             logger.error(f"Signal generation failed for {symbol}: {e}")
             return {"error": f"Signal generation failed: {str(e)}"}
     
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_indicators(self, df: pd.DataFrame, symbol: str, timeframe: str) -> pd.DataFrame:
         """Calculate technical indicators with error handling"""
         try:
-            # Basic indicators for display/fallback
-            df["rsi"] = ta.momentum.rsi(df["close"], window=14)
-            df["ema20"] = ta.trend.ema_indicator(df["close"], window=20)
-            df["ema50"] = ta.trend.ema_indicator(df["close"], window=50)
-            df["macd"] = ta.trend.macd_diff(df["close"])
-            
-            # Additional indicators for improved analysis
-            df["atr"] = ta.volatility.average_true_range(df["high"], df["low"], df["close"], window=14)
-            stoch = ta.momentum.StochasticOscillator(df["high"], df["low"], df["close"])
-            df["stoch_k"] = stoch.stoch()
-            df["stoch_d"] = stoch.stoch_signal()
-            df["adx"] = ta.trend.adx(df["high"], df["low"], df["close"], window=14)
+            # Display/fallback indicators, shared with indicators.signals
+            df = add_indicators_cached(df, symbol, timeframe)
             
             # Fill any remaining NaN values - use newer pandas methods
             df = df.ffill().bfill()
@@ -126,7 +118,7 @@ class UnifiedSignalGenerator:
             return 0.0
         
         if not dependency_manager.is_feature_available("sentiment_analysis"):
-            logger.debug(f"Sentiment analysis not available for {symbol}")
+            logger.debug("Sentiment analysis not available for %s", symbol)
             return 0.0
         
         try:
@@ -214,7 +206,8 @@ class UnifiedSignalGenerator:
                 return "BUY", 0.5  # Default fallback
     
     def _format_response(self, symbol: str, timeframe: str, signal: str, 
-                        confidence: float, df: pd.DataFrame, sentiment_score: float) -> dict:
+                        confidence: float, df: pd.DataFrame, sentiment_score: float,
+                        columnar_chart: bool = False) -> dict:
         """Format the final response with enhanced reliability metrics"""
         try:
             last = df.iloc[-1]
@@ -224,17 +217,7 @@ class UnifiedSignalGenerator:
             reliability_score = self._calculate_reliability_score(df, signal, confidence, sentiment_score)
             
             # Format chart data (last 100 points for performance)
-            chart_data = []
-            df_chart = df.tail(100)  # Only last 100 candles for frontend
-            for index, row in df_chart.iterrows():
-                chart_data.append({
-                    "time": int(row["timestamp"] / 1000),
-                    "open": float(row["open"]),
-                    "high": float(row["high"]),
-                    "low": float(row["low"]),
-                    "close": float(row["close"]),
-                    "volume": float(row.get("volume", 0))
-                })
+            chart_data = build_chart_data(df.tail(100), include_volume=True, columnar=columnar_chart)  # Only last 100 candles for frontend
             
             # Enhanced signal classification
             signal_type = self._classify_signal_type(signal, confidence, signal_strength)
@@ -551,8 +534,8 @@ class UnifiedSignalGenerator:
 unified_signal_generator = UnifiedSignalGenerator()
 
 
-def generate_signal_service(symbol, timeframe):
+def generate_signal_service(symbol, timeframe, columnar_chart=False):
     """
     Generate signal for a given symbol and timeframe using unified generator
     """
-    return unified_signal_generator.generate_signal(symbol, timeframe)
\ No newline at end of file
+    return unified_signal_generator.generate_signal(symbol, timeframe, columnar_chart)
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Signal Writer Service
+Background service that batches signal inserts.
+API handlers enqueue signals; a writer thread flushes them with one
+INSERT per batch instead of one transaction per signal. The same thread
+prunes signals past settings.signal_retention_days once a day.
+"""
+import queue
+import threading
+import time
+from typing import Optional, List, Dict
+
+from config import settings
+from logger import logger
+from database import save_signals_bulk, prune_signals
+
+# Import constants
+try:
+    from constants import SIGNAL_WRITE_BATCH_SIZE, SIGNAL_WRITE_FLUSH_INTERVAL, SIGNAL_PRUNE_INTERVAL
+except ImportError:
+    SIGNAL_WRITE_BATCH_SIZE = 500
+    SIGNAL_WRITE_FLUSH_INTERVAL = 0.2
+    SIGNAL_PRUNE_INTERVAL = 86400
+
+
+class SignalWriterService:
+    """Write-behind buffer for generated signals"""
+    
+    def __init__(self, batch_size: int = SIGNAL_WRITE_BATCH_SIZE, flush_interval: float = SIGNAL_WRITE_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.is_running = False
+        self._queue: "queue.Queue[Dict]" = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next_prune = 0.0
+    
+    def start(self):
+        """Start the writer thread"""
+        if self.is_running:
+            logger.warning("Signal writer already running")
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="signal-writer", daemon=True)
+        self._thread.start()
+        self.is_running = True
+        logger.info(f"💾 Signal writer started (batch: {self.batch_size}, interval: {self.flush_interval}s)")
+    
+    def stop(self):
+        """Stop the writer thread and flush pending signals"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.is_running = False
+        self._flush(self._drain())
+        logger.info("💾 Signal writer stopped")
+    
+    def enqueue(self, signal_data: Dict):
+        """Queue one signal for saving (saved immediately when the writer is not running)"""
+        self.enqueue_many([signal_data])
+    
+    def enqueue_many(self, signals: List[Dict]):
+        """Queue signals for saving (saved immediately when the writer is not running)"""
+        if not self.is_running:
+            self._flush(list(signals))
+            return
+        for signal_data in signals:
+            self._queue.put_nowait(signal_data)
+    
+    def _drain(self, limit: Optional[int] = None) -> List[Dict]:
+        """Pop queued signals without blocking"""
+        batch = []
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run_loop(self):
+        """Collect signals until the batch is full or the flush interval elapsed"""
+        while not self._stop_event.is_set():
+            self._maybe_prune()
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+    
+    def _maybe_prune(self):
+        """Apply the signal retention policy when it is due"""
+        if settings.signal_retention_days <= 0 or time.monotonic() < self._next_prune:
+            return
+        self._next_prune = time.monotonic() + SIGNAL_PRUNE_INTERVAL
+        try:
+            prune_signals(settings.signal_retention_days)
+        except Exception as e:
+            logger.error(f"Failed to prune old signals: {e}")
+    
+    def _flush(self, batch: List[Dict]):
+        """Save a batch; failures are logged, not raised"""
+        if not batch:
+            return
+        try:
+            save_signals_bulk(batch)
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} signals: {e}")
+
+
+# Global instance
+signal_writer = SignalWriterService()
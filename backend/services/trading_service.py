@@ -56,24 +56,40 @@ class TradingService:
     
     def _process_active_sessions(self):
         """Process all active sessions with auto_trade enabled"""
-        from database import SessionLocal, TradingSession, SessionPosition, SessionTrade
+        from database import SessionLocal, ReadSession, TradingSession
+        from services.signal_service import generate_signal_service
+        
+        active = (TradingSession.is_active == 1, TradingSession.auto_trade == 1)
+        
+        db = ReadSession()
+        try:
+            rows = db.query(TradingSession.symbols).filter(*active).all()
+        finally:
+            db.close()
+        
+        if not rows:
+            return
+        
+        # Fetch each symbol's signal once, before opening the writer session:
+        # the writer pool has a single connection and must not be held across
+        # network calls
+        signals = {}
+        for symbol in {s.strip() for (symbols,) in rows for s in symbols.split(",")}:
+            try:
+                signals[symbol] = generate_signal_service(symbol, "1h")
+            except Exception as e:
+                logger.error(f"Error fetching signal for {symbol}: {e}")
         
         db = SessionLocal()
         try:
             # Get all active sessions with auto_trade enabled
-            sessions = db.query(TradingSession).filter(
-                TradingSession.is_active == 1,
-                TradingSession.auto_trade == 1
-            ).all()
-            
-            if not sessions:
-                return
+            sessions = db.query(TradingSession).filter(*active).all()
             
             logger.debug(f"Processing {len(sessions)} active trading sessions")
             
             for session in sessions:
                 try:
-                    self._process_session(db, session)
+                    self._process_session(db, session, signals)
                 except Exception as e:
                     logger.error(f"Error processing session {session.id}: {e}")
             
@@ -85,22 +101,20 @@ class TradingService:
         finally:
             db.close()
     
-    def _process_session(self, db, session):
-        """Process a single trading session"""
-        from database import SessionPosition, SessionTrade
-        from services.signal_service import generate_signal_service
+    def _process_session(self, db, session, signals: Dict[str, dict]):
+        """Process a single trading session against pre-fetched signals"""
+        from database import SessionPosition
         
         symbols = session.symbols.split(",")
         positions = db.query(SessionPosition).filter(
             SessionPosition.session_id == session.id
         ).all()
         
-        # Fetch signals for each symbol
         for symbol in symbols:
             try:
-                signal_data = generate_signal_service(symbol.strip(), "1h")
+                signal_data = signals.get(symbol.strip())
                 
-                if "error" in signal_data:
+                if signal_data is None or "error" in signal_data:
                     continue
                 
                 current_price = signal_data.get("price", 0)
@@ -302,7 +316,6 @@ def create_session(
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         logger.info(f"Created trading session: {name} (ID: {session_id})")
         
@@ -387,7 +400,6 @@ def update_session(session_id: str, updates: Dict) -> Optional[Dict]:
         
         session.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(session)
         
         logger.info(f"Updated session {session_id}: {updates}")
         
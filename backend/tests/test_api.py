@@ -75,3 +75,92 @@ async def test_signals_history():
         data = response.json()
         assert "signals" in data
         assert "count" in data
+
+def _ohlcv(n=150):
+    """Synthetic hourly OHLCV frame shaped like get_binance_data output"""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        "timestamp": 1_700_000_000_000 + np.arange(n, dtype="int64") * 3_600_000,
+        "open": close + rng.normal(0, 0.5, n),
+        "high": close + 2,
+        "low": close - 2,
+        "close": close,
+        "volume": rng.uniform(10, 100, n),
+    })
+
+def test_fast_json_response_renders_signal_payload():
+    """Signal payloads carrying numpy scalars render through orjson"""
+    import orjson
+    from main import FastJSONResponse
+    from indicators.signals import add_indicators
+    from services.signal_service import unified_signal_generator
+
+    df = add_indicators(_ohlcv())
+    payload = unified_signal_generator._format_response("BTCUSDT", "1h", "BUY", 0.7, df, 0.1)
+    assert "error" not in payload
+
+    body = orjson.loads(FastJSONResponse(payload).body)
+    assert body["risk_metrics"]["stop_loss_suggestion"] == pytest.approx(
+        float(payload["risk_metrics"]["stop_loss_suggestion"])
+    )
+    assert len(body["chart_data"]) == 100
+
+@pytest.fixture
+def offline_signals():
+    """Route signal generation through synthetic candles, without persistence"""
+    from unittest.mock import patch
+    from services.signal_service import unified_signal_generator
+    with patch("services.signal_service.get_binance_data", return_value=_ohlcv()), \
+         patch("services.signal_service.predict_with_market_analysis",
+               return_value={"signal": "BUY", "probability": 0.7}), \
+         patch.object(unified_signal_generator, "_get_sentiment_score", return_value=0.0), \
+         patch("main.signal_writer") as writer:
+        yield writer
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("columnar", [False, True])
+async def test_get_signal_chart_layout(offline_signals, columnar):
+    """/get-signal honours columnar_chart"""
+    from httpx import ASGITransport
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/get-signal",
+            json={"symbol": "BTCUSDT", "timeframe": "1h", "columnar_chart": columnar}
+        )
+    assert response.status_code == 200
+    chart = response.json()["chart_data"]
+    if columnar:
+        assert isinstance(chart, dict) and len(chart["close"]) == 100
+    else:
+        assert isinstance(chart, list) and len(chart) == 100
+    offline_signals.enqueue.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_multi_signals_columnar_chart(offline_signals):
+    """/signals/multi forwards columnar_chart for every symbol"""
+    from httpx import ASGITransport
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/signals/multi",
+            json={"symbols": ["BTCUSDT", "ETHUSDT"], "timeframe": "1h", "columnar_chart": True}
+        )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"]["failed"] == 0
+    for signal in data["signals"]:
+        assert isinstance(signal["chart_data"], dict)
+
+@pytest.mark.asyncio
+async def test_detailed_health_checks_database_on_reader():
+    """/health/detailed probes the database through the read-only session"""
+    from httpx import ASGITransport
+    from unittest.mock import patch
+    import database
+    with patch.object(database, "SessionLocal", side_effect=AssertionError("writer session used")):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/health/detailed")
+    assert response.status_code == 200
+    assert response.json()["components"]["database"]["status"] == "healthy"
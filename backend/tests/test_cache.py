@@ -0,0 +1,97 @@
+"""
+Tests for cache module
+"""
+import inspect
+import time
+from unittest.mock import patch
+from cache import SimpleCache
+
+
+class FakeClock:
+    """Manually advanced timer for TTL tests"""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+class TestSimpleCache:
+    """Test the in-memory TTL cache"""
+    
+    def test_set_and_get(self):
+        """Test that a stored value is returned before it expires"""
+        c = SimpleCache()
+        c.set("key", {"a": 1}, ttl=60)
+        assert c.get("key") == {"a": 1}
+    
+    def test_tuple_keys(self):
+        """Test that tuple keys are stored and deleted like string keys"""
+        c = SimpleCache()
+        c.set(("binance_data", "BTCUSDT", "1h", 100), "value", ttl=60)
+        assert c.get(("binance_data", "BTCUSDT", "1h", 100)) == "value"
+        assert c.get(("binance_data", "BTCUSDT", "1h", 500)) is None
+        c.delete(("binance_data", "BTCUSDT", "1h", 100))
+        assert c.get(("binance_data", "BTCUSDT", "1h", 100)) is None
+    
+    def test_missing_key_returns_none(self):
+        """Test that unknown keys return None"""
+        assert SimpleCache().get("missing") is None
+    
+    def test_expired_entry_is_removed(self):
+        """Test that an entry is not returned after its TTL"""
+        clock = FakeClock()
+        c = SimpleCache(timer=clock)
+        c.set("key", "value", ttl=10)
+        clock.now += 11
+        assert c.get("key") is None
+    
+    def test_per_key_ttl(self):
+        """Test that each key keeps its own TTL"""
+        clock = FakeClock()
+        c = SimpleCache(timer=clock)
+        c.set("short", 1, ttl=5)
+        c.set("long", 2, ttl=60)
+        clock.now += 30
+        assert c.get("short") is None
+        assert c.get("long") == 2
+    
+    def test_expired_entries_are_evicted_on_write(self):
+        """Test that unread expired entries do not accumulate"""
+        clock = FakeClock()
+        c = SimpleCache(timer=clock)
+        c.set("old", "value", ttl=5)
+        clock.now += 10
+        c.set("new", "value", ttl=60)
+        assert len(c._cache) == 1
+    
+    def test_size_is_bounded(self):
+        """Test that the cache never grows past maxsize"""
+        c = SimpleCache(maxsize=3)
+        for i in range(10):
+            c.set(f"key{i}", i, ttl=60)
+        assert len(c._cache) == 3
+        assert c.get("key9") == 9
+    
+    def test_delete_and_clear(self):
+        """Test explicit removal"""
+        c = SimpleCache()
+        c.set("a", 1, ttl=60)
+        c.set("b", 2, ttl=60)
+        c.delete("a")
+        c.delete("missing")
+        assert c.get("a") is None
+        c.clear()
+        assert c.get("b") is None
+    
+    def test_expiry_ignores_wall_clock_changes(self):
+        """Test that expiry follows the monotonic timer, not a wall-clock jump"""
+        assert inspect.signature(SimpleCache).parameters["timer"].default is time.monotonic
+        clock = FakeClock()
+        c = SimpleCache(timer=clock)
+        c.set("key", "value", ttl=60)
+        with patch("time.time", return_value=10 ** 12):
+            assert c.get("key") == "value"
+            clock.now += 61
+            assert c.get("key") is None
@@ -0,0 +1,143 @@
+"""
+Tests for database query plans and history caching
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, insert, select, tuple_
+import database
+from database import Base, Signal
+
+
+def _query_plan(query):
+    """Return SQLite's EXPLAIN QUERY PLAN details for a query on a fresh in-memory schema"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return " | ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+
+
+class TestSignalHistoryPlan:
+    """Test that history reads are served by the (symbol, timestamp) index"""
+    
+    def test_symbol_history_seeks_composite_index(self):
+        """Test that filter + sort is a single index range scan without a sort step"""
+        plan = _query_plan(
+            select(Signal.id)
+            .where(Signal.symbol == "BTCUSDT")
+            .order_by(Signal.timestamp.desc(), Signal.id.desc())
+            .limit(50)
+        )
+        assert "ix_signals_symbol_ts (symbol=?)" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_keyset_page_seeks_past_cursor(self):
+        """Test that the keyset cursor becomes part of the index range"""
+        plan = _query_plan(
+            select(Signal.id)
+            .where(Signal.symbol == "BTCUSDT")
+            .where(tuple_(Signal.timestamp, Signal.id) < (datetime(2024, 1, 1), 10))
+            .order_by(Signal.timestamp.desc(), Signal.id.desc())
+            .limit(50)
+        )
+        assert "ix_signals_symbol_ts (symbol=? AND timestamp<?)" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_no_standalone_symbol_index(self):
+        """Test that symbol has no single-column index duplicating the composite prefix"""
+        names = {index.name for index in Signal.__table__.indexes}
+        assert "ix_signals_symbol" not in names
+        assert "ix_signals_symbol_ts" in names
+
+    
+    def test_duplicate_signal_is_ignored(self):
+        """Test that INSERT OR IGNORE keeps one signal per symbol/timeframe/candle"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        # Same insert time for every row, as in one writer batch
+        row = {"symbol": "BTCUSDT", "timeframe": "1h", "signal": "BUY",
+               "timestamp": datetime(2024, 1, 1), "candle_time": 1704067200000}
+        stmt = insert(Signal).prefix_with("OR IGNORE", dialect="sqlite")
+        with engine.begin() as conn:
+            inserted = conn.execute(stmt, [
+                row, dict(row, signal="SELL"), dict(row, timeframe="4h"),
+                dict(row, candle_time=1704070800000)
+            ]).rowcount
+        assert inserted == 3
+
+
+class TestSignalHistoryCache:
+    """Test the short-lived history page cache"""
+    
+    def _fake_conn(self):
+        conn = MagicMock()
+        conn.execute.return_value = [(1, "BTCUSDT", "1h", "BUY", 0.8, 100.0, 30.0, 1.0, 2.0, 0.1, datetime(2024, 1, 1))]
+        
+        @contextmanager
+        def fake_ro_conn():
+            yield conn
+        return conn, fake_ro_conn
+    
+    def test_repeat_page_is_served_from_cache(self):
+        """Test that identical history requests hit the database once"""
+        conn, fake_ro_conn = self._fake_conn()
+        database._history_cache.clear()
+        with patch.object(database, "ro_conn", fake_ro_conn):
+            first = database.get_signal_history("BTCUSDT", 10, 0)
+            second = database.get_signal_history("BTCUSDT", 10, 0)
+        assert conn.execute.call_count == 1
+        assert first == second
+        assert first is not second
+    
+    def test_write_invalidates_cached_pages(self):
+        """Test that new signals make cached pages stale"""
+        conn, fake_ro_conn = self._fake_conn()
+        database._history_cache.clear()
+        with patch.object(database, "ro_conn", fake_ro_conn):
+            database.get_signal_history("BTCUSDT", 10, 0)
+            database._invalidate_history_cache()
+            database.get_signal_history("BTCUSDT", 10, 0)
+        assert conn.execute.call_count == 2
+
+
+class TestWriterTransactions:
+    """Test that only write transactions take the SQLite write lock up front"""
+    
+    @staticmethod
+    def _engine(path):
+        engine = create_engine(f"sqlite:///{path}")
+        database._use_immediate_transactions(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+        return engine
+    
+    @staticmethod
+    def _write_lock_taken(path):
+        import sqlite3
+        other = sqlite3.connect(path, timeout=0, isolation_level=None)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            other.execute("ROLLBACK")
+            return False
+        except sqlite3.OperationalError as e:
+            assert "locked" in str(e)
+            return True
+        finally:
+            other.close()
+    
+    def test_write_transaction_is_immediate(self, tmp_path):
+        """Test that a sqlite_immediate transaction holds the write lock before its first write"""
+        path = tmp_path / "w.db"
+        engine = self._engine(path).execution_options(sqlite_immediate=True)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("SELECT count(*) FROM t").scalar()
+            assert self._write_lock_taken(path)
+    
+    def test_read_transaction_is_deferred(self, tmp_path):
+        """Test that a plain transaction that only reads leaves the write lock free"""
+        path = tmp_path / "w.db"
+        engine = self._engine(path)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("SELECT count(*) FROM t").scalar()
+            assert not self._write_lock_taken(path)
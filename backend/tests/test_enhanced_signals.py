@@ -2,6 +2,7 @@
 Tests for enhanced signal reliability improvements
 """
 
+import json
 import pytest
 import pandas as pd
 import numpy as np
@@ -114,6 +115,114 @@ class TestEnhancedDataFetcher:
         # NaN should be filled
         assert not cleaned_df.isnull().any().any()
     
+    def test_ohlc_logic_errors_are_counted(self):
+        """Test that candles whose high/low do not bound open and close are reported"""
+        df = pd.DataFrame({
+            'timestamp': [1, 2, 3],
+            'open': [100.0, 100.0, 100.0],
+            'high': [110.0, 95.0, 110.0],
+            'low': [90.0, 90.0, 105.0],
+            'close': [105.0, 92.0, 108.0],
+            'volume': [1.0, 1.0, 1.0]
+        })
+        with patch("indicators.signals.logger") as log:
+            self.fetcher.validate_data_quality(df, "BTCUSDT")
+        
+        assert "OHLC logic errors for BTCUSDT: 2 records" in log.warning.call_args[0][0]
+    
+    def test_cached_frame_roundtrip(self):
+        """Test that cached candles rebuild an equal, independent DataFrame"""
+        raw = [[1640995200000 + i, "50000", "50200", "49900", "50100", "1000"] for i in range(3)]
+        df = self.fetcher._parse_klines(raw)
+        cached = self.fetcher._frame_to_cache(df)
+        
+        rebuilt = self.fetcher._frame_from_cache(cached)
+        assert rebuilt.equals(df)
+        
+        rebuilt["close"] += 1
+        assert self.fetcher._frame_from_cache(cached)["close"].iat[0] == 50100
+    
+    def test_kline_parsing(self):
+        """Test parsing of raw Binance klines, including malformed values"""
+        raw = [[1640995200000, "50000.5", "50200", "49900", "50100", "1000", 1640998799999, "0", 10]] * 2
+        df = self.fetcher._parse_klines(raw)
+        
+        assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert df["timestamp"].dtype == np.int64
+        assert df["open"].iat[0] == 50000.5
+        
+        df_bad = self.fetcher._parse_klines([[1640995200000, "oops", "50200", "49900", "50100", "1000"]] + raw)
+        assert np.isnan(df_bad["open"].iat[0])
+        assert df_bad["close"].iat[1] == 50100
+    
+    def test_conditional_refetch_uses_etag(self):
+        """Test that a 304 answer reuses the candles of the previous response"""
+        raw = [[1640995200000 + i, "50000", "50200", "49900", "50100", "1000"] for i in range(60)]
+        fresh = Mock(status_code=200, headers={"ETag": '"abc"'}, content=json.dumps(raw).encode())
+        not_modified = Mock(status_code=304, headers={})
+        
+        with patch("indicators.signals._BINANCE_SESSION.get", side_effect=[fresh, not_modified]) as get:
+            first = self.fetcher._fetch_from_api("BTCUSDT", "1h", 60)
+            second = self.fetcher._fetch_from_api("BTCUSDT", "1h", 60)
+        
+        assert get.call_args_list[0].kwargs["headers"] is None
+        assert get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert second.equals(first)
+    
+    def test_concurrent_misses_share_one_fetch(self):
+        """Test that identical concurrent fetches make a single API call"""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from cache import cache
+        cache.clear()
+        raw = [[1640995200000 + i, "50000", "50200", "49900", "50100", "1000"] for i in range(60)]
+        calls = []
+        
+        def slow_fetch(symbol, interval, limit):
+            calls.append(symbol)
+            time.sleep(0.2)
+            return self.fetcher._parse_klines(raw)
+        
+        with patch.object(self.fetcher, "_fetch_from_api", side_effect=slow_fetch):
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                frames = list(pool.map(lambda _: self.fetcher.fetch_market_data("ETHUSDT", "1h", 60), range(5)))
+        
+        assert len(calls) == 1
+        assert all(frame.equals(frames[0]) for frame in frames)
+        assert not self.fetcher._inflight
+    
+    @staticmethod
+    def _http_error(status, headers=None):
+        """Response mock whose raise_for_status fails with the given status"""
+        import requests
+        response = Mock(status_code=status, headers=headers or {})
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+        return response
+    
+    def test_unrecoverable_status_is_not_retried(self):
+        """Test that a 400 (e.g. unknown symbol) fails without further attempts"""
+        with patch("indicators.signals._BINANCE_SESSION.get", return_value=self._http_error(400)) as get, \
+             patch("indicators.signals.time.sleep") as sleep:
+            with pytest.raises(BinanceAPIError) as exc_info:
+                self.fetcher._fetch_from_api("NOPEUSDT", "1h", 60)
+        
+        assert get.call_count == 1
+        sleep.assert_not_called()
+        assert exc_info.value.status_code == 400
+    
+    def test_rate_limit_honors_retry_after(self):
+        """Test that a 429 waits for Retry-After before retrying"""
+        raw = [[1640995200000 + i, "50000", "50200", "49900", "50100", "1000"] for i in range(60)]
+        ok = Mock(status_code=200, headers={}, content=json.dumps(raw).encode())
+        limited = self._http_error(429, {"Retry-After": "3"})
+        
+        with patch("indicators.signals._BINANCE_SESSION.get", side_effect=[limited, ok]), \
+             patch("indicators.signals.time.sleep") as sleep:
+            df = self.fetcher._fetch_from_api("BTCUSDT", "1h", 60)
+        
+        sleep.assert_called_once_with(3.0)
+        assert len(df) == 60
+    
     def test_invalid_price_data_rejection(self):
         """Test rejection of invalid price data"""
         # Create DataFrame with invalid prices
@@ -155,6 +264,29 @@ class TestDependencyManager:
         assert isinstance(ml_available, bool)
         assert isinstance(ta_available, bool)
     
+    def test_validation_runs_once(self):
+        """Test that repeated validation reuses the first result"""
+        first = self.manager.validate_dependencies()
+        missing = list(first.missing)
+        
+        with patch("dependency_manager.importlib.import_module") as import_module:
+            second = self.manager.validate_dependencies()
+        
+        import_module.assert_not_called()
+        assert second is first
+        assert second.missing == missing
+    
+    def test_feature_availability_is_memoized(self):
+        """Test that feature checks are cached after validation"""
+        self.manager.validate_dependencies()
+        available = self.manager.is_feature_available("technical_analysis")
+        
+        self.manager.status.available["ta"] = not self.manager.status.available.get("ta", False)
+        assert self.manager.is_feature_available("technical_analysis") == available
+        
+        self.manager.validate_dependencies(force=True)
+        assert self.manager.is_feature_available("technical_analysis") == available
+    
     def test_fallback_function_retrieval(self):
         """Test fallback function retrieval"""
         fallback = self.manager.get_fallback_for_missing_dependency("textblob")
@@ -214,6 +346,16 @@ class TestErrorHandling:
         assert error_dict["message"] == "Prediction failed"
         assert error_dict["context"]["symbol"] == "BTCUSDT"
         assert "timestamp" in error_dict
+    
+    def test_exception_timestamp_is_lazy(self):
+        """Test that the clock is only read when the timestamp is used"""
+        with patch("exceptions.time.time", return_value=1234.5) as clock:
+            error = BinanceAPIError("Rate limit exceeded", status_code=429)
+            clock.assert_not_called()
+            
+            assert error.to_dict()["timestamp"] == 1234.5
+            assert error.timestamp == 1234.5
+            clock.assert_called_once()
 
 
 # Property-based tests (if hypothesis is available)
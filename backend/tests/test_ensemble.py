@@ -6,7 +6,8 @@ import pytest
 import pandas as pd
 import numpy as np
 from sklearn.datasets import make_classification
-from ml.ensemble import EnsembleTrainer, load_ensemble, predict_with_ensemble
+import json
+from ml.ensemble import EnsembleTrainer, load_ensemble, predict_with_ensemble, save_ensemble_metadata
 
 
 @pytest.fixture
@@ -196,3 +197,22 @@ def test_predict_with_ensemble_function(sample_data):
     assert 'probability' in result
     assert 'model_used' in result
     assert 'individual_predictions' in result
+
+
+def test_save_ensemble_metadata(tmp_path):
+    """Test summary sidecar written next to the ensemble pickle"""
+    ensemble_path = tmp_path / 'ensemble_BTCUSDT_1h_latest.pkl'
+    ensemble_data = {
+        'performance': {'stacking': {'test_accuracy': np.float64(0.61)}},
+        'best_model_name': 'stacking',
+        'best_accuracy': np.float64(0.61)
+    }
+    
+    save_ensemble_metadata(ensemble_data, ensemble_path)
+    
+    with open(tmp_path / 'ensemble_BTCUSDT_1h_latest.meta.json') as f:
+        metadata = json.load(f)
+    
+    assert metadata['best_model_name'] == 'stacking'
+    assert metadata['best_accuracy'] == pytest.approx(0.61)
+    assert metadata['stacking_acc'] == pytest.approx(0.61)
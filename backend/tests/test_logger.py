@@ -0,0 +1,73 @@
+"""
+Tests for logger_enhanced module
+"""
+import json
+import logging
+import numpy as np
+from logging.handlers import QueueHandler
+import logger_enhanced
+from logger_enhanced import JSONFormatter, setup_logger
+
+
+class TestJSONFormatter:
+    """Test structured log formatting"""
+    
+    def test_format_produces_valid_json(self):
+        """Test that records, extra fields and numpy scalars serialize to JSON"""
+        record = logging.LogRecord("crypto_ai", logging.INFO, __file__, 10, "fetched %d candles", (500,), None)
+        record.created = 1640995200.25
+        record.extra_fields = {"symbol": "BTCUSDT", "price": np.float64(50100.5), "obj": object()}
+        
+        data = json.loads(JSONFormatter().format(record))
+        
+        assert data["timestamp"] == "2022-01-01T00:00:00.250000Z"
+        assert data["message"] == "fetched 500 candles"
+        assert data["level"] == "INFO"
+        assert data["price"] == 50100.5
+        assert data["obj"].startswith("<object")
+
+
+class TestSetupLogger:
+    """Test logger wiring"""
+    
+    def test_records_are_written_by_the_queue_listener(self, tmp_path):
+        """Test that the logger only enqueues and the listener writes the file"""
+        log_file = tmp_path / "app.log"
+        log = setup_logger("test_queue", log_file=str(log_file))
+        assert len(log.handlers) == 1 and isinstance(log.handlers[0], QueueHandler)
+        
+        log.info("queued message")
+        logger_enhanced._listeners.pop("test_queue")[1].stop()
+        
+        assert "queued message" in log_file.read_text(encoding="utf-8")
+    
+    def test_json_records_keep_exception_info(self, tmp_path):
+        """Test that exceptions survive the queue and reach the JSON output"""
+        log_file = tmp_path / "app.log"
+        log = setup_logger("test_queue_exc", log_file=str(log_file), json_format=True)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("failed %s", "fetch")
+        logger_enhanced._listeners.pop("test_queue_exc")[1].stop()
+        
+        data = json.loads(log_file.read_text(encoding="utf-8").splitlines()[0])
+        assert data["message"] == "failed fetch"
+        assert "ValueError: boom" in data["exception"]
+        assert data["stack_trace"][-1].startswith("ValueError")
+    
+    def test_setup_twice_keeps_a_single_handler(self, tmp_path):
+        """Test that re-running setup never attaches handlers twice"""
+        setup_logger("test_requeue", log_file=str(tmp_path / "a.log"))
+        first = logger_enhanced._listeners["test_requeue"][1]
+        
+        # Same file: existing wiring is kept
+        log = setup_logger("test_requeue", log_file=str(tmp_path / "a.log"))
+        assert len(log.handlers) == 1
+        assert logger_enhanced._listeners["test_requeue"][1] is first
+        
+        # Different file: handlers and listener are replaced
+        log = setup_logger("test_requeue", log_file=str(tmp_path / "b.log"))
+        assert len(log.handlers) == 1
+        assert logger_enhanced._listeners["test_requeue"][1] is not first
+        logger_enhanced._listeners.pop("test_requeue")[1].stop()
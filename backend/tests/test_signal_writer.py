@@ -0,0 +1,77 @@
+"""
+Tests for the batched signal writer
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from services.signal_writer import SignalWriterService
+
+
+def _signal(i):
+    return {"symbol": f"SYM{i}", "timeframe": "1h", "signal": "BUY"}
+
+
+class TestSignalWriterService:
+    """Test write-behind batching of signals"""
+    
+    def test_saves_directly_when_not_running(self):
+        """Test that signals are written synchronously before start()"""
+        writer = SignalWriterService()
+        with patch("services.signal_writer.save_signals_bulk") as save:
+            writer.enqueue(_signal(1))
+        save.assert_called_once_with([_signal(1)])
+    
+    def test_batches_queued_signals(self):
+        """Test that signals queued within one interval share a single insert"""
+        writer = SignalWriterService(batch_size=100, flush_interval=0.05)
+        with patch("services.signal_writer.save_signals_bulk") as save:
+            writer.start()
+            writer.enqueue_many([_signal(i) for i in range(10)])
+            time.sleep(0.3)
+            writer.stop()
+        saved = [row for call in save.call_args_list for row in call.args[0]]
+        assert saved == [_signal(i) for i in range(10)]
+        assert save.call_count == 1
+    
+    def test_batch_size_caps_each_insert(self):
+        """Test that a batch never exceeds batch_size rows"""
+        writer = SignalWriterService(batch_size=3, flush_interval=0.05)
+        with patch("services.signal_writer.save_signals_bulk") as save:
+            writer.start()
+            writer.enqueue_many([_signal(i) for i in range(7)])
+            time.sleep(0.3)
+            writer.stop()
+        assert all(len(call.args[0]) <= 3 for call in save.call_args_list)
+        assert sum(len(call.args[0]) for call in save.call_args_list) == 7
+    
+    def test_stop_flushes_pending(self):
+        """Test that stop() writes signals still in the queue"""
+        writer = SignalWriterService(flush_interval=10)
+        with patch("services.signal_writer.save_signals_bulk") as save:
+            writer.is_running = True  # queue without a writer thread
+            writer.enqueue(_signal(1))
+            writer.stop()
+        save.assert_called_once_with([_signal(1)])
+    
+    def test_save_errors_are_logged_not_raised(self):
+        """Test that a failing insert does not propagate to the caller"""
+        writer = SignalWriterService()
+        with patch("services.signal_writer.save_signals_bulk", side_effect=RuntimeError("db down")):
+            writer.enqueue(_signal(1))
+    
+    def test_retention_disabled_by_default(self):
+        """Test that nothing is pruned when signal_retention_days is 0"""
+        writer = SignalWriterService()
+        with patch("services.signal_writer.settings", SimpleNamespace(signal_retention_days=0)), \
+             patch("services.signal_writer.prune_signals") as prune:
+            writer._maybe_prune()
+        prune.assert_not_called()
+    
+    def test_retention_runs_once_per_interval(self):
+        """Test that pruning runs at most once per SIGNAL_PRUNE_INTERVAL"""
+        writer = SignalWriterService()
+        with patch("services.signal_writer.settings", SimpleNamespace(signal_retention_days=30)), \
+             patch("services.signal_writer.prune_signals") as prune:
+            writer._maybe_prune()
+            writer._maybe_prune()
+        prune.assert_called_once_with(30)
@@ -61,3 +61,212 @@ def test_generate_signal_invalid_symbol():
     result = generate_signal("INVALID", "1h")
     # Should return error or handle gracefully
     assert "error" in result or "signal" in result
+
+def _candles(last_ts, last_close=2.0):
+    """Minimal frame whose last candle opens at last_ts"""
+    import pandas as pd
+    return pd.DataFrame({
+        "timestamp": [last_ts - 3600000, last_ts],
+        "open": [1.0, 1.0], "high": [2.5, 2.5], "low": [0.5, 0.5],
+        "close": [1.0, last_close], "volume": [10.0, 10.0]
+    })
+
+def test_generate_signal_reuses_result_within_candle():
+    """Test that a repeated request on the same candle skips recomputation"""
+    from unittest.mock import patch
+    from cache import cache
+    cache.clear()
+    with patch("indicators.signals.get_binance_data", return_value=_candles(7200000)), \
+         patch("indicators.signals._build_signal", return_value={"signal": "BUY"}) as build:
+        first = generate_signal("BTCUSDT", "1h")
+        second = generate_signal("BTCUSDT", "1h")
+    assert build.call_count == 1
+    assert first == second == {"signal": "BUY"}
+
+def test_generate_signal_recomputes_on_new_candle():
+    """Test that a new candle produces a new cache key"""
+    from unittest.mock import patch
+    from cache import cache
+    cache.clear()
+    with patch("indicators.signals.get_binance_data", side_effect=[_candles(7200000), _candles(10800000)]), \
+         patch("indicators.signals._build_signal", return_value={"signal": "BUY"}) as build:
+        generate_signal("BTCUSDT", "1h")
+        generate_signal("BTCUSDT", "1h")
+    assert build.call_count == 2
+
+def test_generate_signal_recomputes_on_live_candle_update():
+    """Test that a tick on the still-open candle is not served from cache"""
+    from unittest.mock import patch
+    from cache import cache
+    cache.clear()
+    with patch("indicators.signals.get_binance_data",
+               side_effect=[_candles(7200000), _candles(7200000, last_close=2.1)]), \
+         patch("indicators.signals._build_signal", return_value={"signal": "BUY"}) as build:
+        generate_signal("BTCUSDT", "1h")
+        generate_signal("BTCUSDT", "1h")
+    assert build.call_count == 2
+
+def test_generate_signal_ttl_is_capped():
+    """Test that cached responses are kept for cache_ttl, not a whole interval"""
+    from unittest.mock import patch
+    from cache import cache
+    from config import settings
+    cache.clear()
+    with patch("indicators.signals.get_binance_data", return_value=_candles(7200000)), \
+         patch("indicators.signals._build_signal", return_value={"signal": "BUY"}), \
+         patch.object(cache, "set", wraps=cache.set) as put:
+        generate_signal("BTCUSDT", "1w")
+    assert put.call_args.kwargs["ttl"] == min(settings.cache_ttl, 604800)
+
+def test_decide_signal_branches():
+    """Test the scalar decision kernel against each branch of the signal logic"""
+    from indicators.signals import _decide_signal, SIGNAL_LABELS
+
+    def decide(prob, rsi, close, ema20):
+        return SIGNAL_LABELS[_decide_signal(prob, rsi, close, ema20, 30.0, 70.0, 0.6, 0.4)]
+
+    assert decide(0.65, 25, 100, 110) == "BUY"
+    assert decide(0.35, 75, 100, 90) == "SELL"
+    assert decide(0.62, 50, 110, 100) == "BUY (Trend)"
+    assert decide(0.38, 50, 90, 100) == "SELL (Trend)"
+    assert decide(0.55, 50, 110, 100) == "BUY"
+    assert decide(0.55, 50, 90, 100) == "BUY (Weak)"
+    assert decide(0.45, 50, 90, 100) == "SELL"
+    assert decide(0.45, 50, 110, 100) == "SELL (Weak)"
+
+def test_build_signal_waits_for_background_sentiment():
+    """Test that the sentiment fetched in the background reaches the response"""
+    import numpy as np
+    import pandas as pd
+    from unittest.mock import patch
+    from config import settings
+    from cache import cache
+    from indicators.signals import _build_signal
+    cache.clear()
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(size=100))
+    df = pd.DataFrame({
+        "timestamp": np.arange(100) * 3600000, "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.full(100, 10.0)
+    })
+    with patch("indicators.signals.settings", settings.model_copy(update={"sentiment_enabled": True})), \
+         patch("indicators.signals._fetch_sentiment", return_value=0.25) as fetch, \
+         patch("indicators.signals.predict_direction", return_value=0.55):
+        result = _build_signal(df, "BTCUSDT", "BTCUSDT", "1h", False, None)
+    fetch.assert_called_once_with("BTCUSDT")
+    assert result["sentiment"] == 0.25
+    assert result["signal"] in ("BUY", "BUY (Weak)")
+
+def test_fused_emas_match_ta():
+    """Test that the fused EMA/MACD kernel reproduces the ta library output"""
+    import numpy as np
+    import pandas as pd
+    import ta
+    from indicators.signals import _fused_emas
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(1).normal(size=300)))
+    ema20, ema50, macd = _fused_emas(close.to_numpy())
+    np.testing.assert_allclose(ema20, ta.trend.ema_indicator(close, window=20))
+    np.testing.assert_allclose(ema50, ta.trend.ema_indicator(close, window=50))
+    np.testing.assert_allclose(macd, ta.trend.macd_diff(close))
+
+def test_build_chart_data_columnar():
+    """Test that the columnar chart payload carries the same values as the row form"""
+    from indicators.signals import build_chart_data
+    import pandas as pd
+    df = pd.DataFrame({
+        "timestamp": [3600000, 7200000], "open": [1.0, 2.0], "high": [2.0, 3.0],
+        "low": [0.5, 1.5], "close": [1.5, 2.5], "volume": [10.0, 20.0]
+    })
+    rows = build_chart_data(df, include_volume=True)
+    columns = build_chart_data(df, include_volume=True, columnar=True)
+    assert columns == {key: [row[key] for row in rows] for key in rows[0]}
+    assert columns["time"] == [3600, 7200]
+
+def test_add_indicators_appends_columns_once():
+    """Test that indicators are appended in one block and recomputing does not duplicate them"""
+    import numpy as np
+    import pandas as pd
+    from indicators.signals import add_indicators, INDICATOR_COLUMNS
+    close = 100 + np.cumsum(np.random.default_rng(2).normal(size=120))
+    df = pd.DataFrame({
+        "timestamp": np.arange(120), "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.ones(120)
+    })
+    out = add_indicators(df)
+    assert list(out.columns[6:]) == list(INDICATOR_COLUMNS)
+    assert list(add_indicators(out).columns) == list(out.columns)
+
+def test_add_indicators_cached_reuses_block_until_candle_changes():
+    """Test that indicators are recomputed only when the last candle's data changes"""
+    import numpy as np
+    import pandas as pd
+    from unittest.mock import patch
+    from cache import cache
+    from indicators import signals
+    cache.clear()
+    close = 100 + np.cumsum(np.random.default_rng(3).normal(size=120))
+    df = pd.DataFrame({
+        "timestamp": np.arange(120), "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.ones(120)
+    })
+    with patch("indicators.signals.add_indicators", wraps=signals.add_indicators) as compute:
+        first = signals.add_indicators_cached(df, "BTCUSDT", "1h")
+        second = signals.add_indicators_cached(df.copy(), "BTCUSDT", "1h")
+        assert compute.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+        
+        updated = df.copy()
+        updated.loc[119, "close"] += 5
+        signals.add_indicators_cached(updated, "BTCUSDT", "1h")
+        assert compute.call_count == 2
+
+def test_add_indicators_cached_ttl_is_capped():
+    """Test that live-candle blocks are kept for cache_ttl, not a whole interval"""
+    import numpy as np
+    import pandas as pd
+    from unittest.mock import patch
+    from cache import cache
+    from config import settings
+    from indicators import signals
+    cache.clear()
+    close = 100 + np.cumsum(np.random.default_rng(4).normal(size=120))
+    df = pd.DataFrame({
+        "timestamp": np.arange(120), "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.ones(120)
+    })
+    with patch.object(cache, "set", wraps=cache.set) as put:
+        signals.add_indicators_cached(df, "BTCUSDT", "1w")
+    assert put.call_args.kwargs["ttl"] == min(settings.cache_ttl, 604800)
+
+def test_sentiment_score_is_cached_per_symbol():
+    """Test that a second signal reuses the cached sentiment instead of calling the analyzer"""
+    import numpy as np
+    import pandas as pd
+    from unittest.mock import Mock, patch
+    from cache import cache
+    from config import settings
+    from indicators.signals import _build_signal
+    cache.clear()
+    close = 100 + np.cumsum(np.random.default_rng(4).normal(size=100))
+    df = pd.DataFrame({
+        "timestamp": np.arange(100) * 3600000, "open": close, "high": close + 1,
+        "low": close - 1, "close": close, "volume": np.full(100, 10.0)
+    })
+    analyzer = Mock()
+    analyzer.get_aggregated_sentiment.return_value = {"aggregated_sentiment": -0.4}
+    with patch("indicators.signals.settings", settings.model_copy(update={"sentiment_enabled": True})), \
+         patch("indicators.signals._get_sentiment_analyzer", return_value=analyzer), \
+         patch("indicators.signals.predict_direction", return_value=0.45):
+        first = _build_signal(df, "BTCUSDT", "BTCUSDT", "1h", False, None)
+        second = _build_signal(df, "BTCUSDT", "BTCUSDT", "1h", False, None)
+    assert analyzer.get_aggregated_sentiment.call_count == 1
+    assert first["sentiment"] == second["sentiment"] == -0.4
+
+def test_latest_values_are_plain_floats():
+    """Test that last-candle values are Python floats and indicators are rounded from them"""
+    import pandas as pd
+    from indicators.signals import latest_values, latest_indicators, INDICATOR_COLUMNS
+    df = pd.DataFrame({col: [0.0, 1.23456] for col in ("close",) + INDICATOR_COLUMNS})
+    values = latest_values(df)
+    assert all(type(v) is float for v in values.values())
+    assert values["close"] == 1.23456
+    assert latest_indicators(df, values) == latest_indicators(df) == {col: 1.23 for col in INDICATOR_COLUMNS}
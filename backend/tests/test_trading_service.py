@@ -0,0 +1,42 @@
+"""
+Tests for the background trading loop
+"""
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from database import Base, TradingSession, SessionPosition
+from services.trading_service import TradingService
+
+
+def _session_row(session_id, symbols):
+    return TradingSession(
+        id=session_id, name=session_id, strategy_name="Balanced",
+        strategy_risk_per_trade=0.02, strategy_stop_loss=0.03, strategy_take_profit=0.06,
+        strategy_max_positions=5, strategy_trailing_stop=0, symbols=symbols,
+        initial_balance=10000.0, current_balance=10000.0, is_active=1, auto_trade=1
+    )
+
+
+def test_signals_fetched_outside_writer_session(tmp_path):
+    """Test that signals are fetched once per symbol while no writer connection is held"""
+    engine = create_engine(f"sqlite:///{tmp_path / 't.db'}", pool_size=1, max_overflow=0, pool_timeout=1)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with factory() as db:
+        db.add_all([_session_row("a", "BTCUSDT,ETHUSDT"), _session_row("b", "BTCUSDT")])
+        db.commit()
+    
+    def fake_signal(symbol, timeframe):
+        assert engine.pool.checkedout() == 0
+        return {"symbol": symbol, "price": 100.0, "signal": "BUY", "confidence": 0.9}
+    
+    with patch("database.SessionLocal", factory), patch("database.ReadSession", factory), \
+         patch("services.signal_service.generate_signal_service", side_effect=fake_signal) as gen:
+        TradingService()._process_active_sessions()
+    
+    assert sorted(call.args[0] for call in gen.call_args_list) == ["BTCUSDT", "ETHUSDT"]
+    with factory() as db:
+        positions = db.query(SessionPosition).order_by(SessionPosition.session_id, SessionPosition.symbol).all()
+        assert [(p.session_id, p.symbol) for p in positions] == [
+            ("a", "BTCUSDT"), ("a", "ETHUSDT"), ("b", "BTCUSDT")
+        ]